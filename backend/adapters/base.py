@@ -38,3 +38,6 @@ class BaseAdapter(ABC):
     def get_provider_id(self) -> str:
         """Returns the provider identifier."""
         pass
+
+    async def close(self) -> None:
+        """Releases connections kept open across calls. No-op by default."""
@@ -11,15 +11,19 @@ assets across multiple API endpoints (e.g., Simple Earn assets showing up in bot
 the Spot 'LD' view and the specialized Simple Earn endpoint).
 """
 
-from typing import List, Dict, Any, Optional
-import ccxt
+from typing import List, Dict, Any, Optional, Tuple
+import ccxt.async_support as ccxt_async
 import asyncio
 import logging
+import random
+from weakref import WeakKeyDictionary
 from adapters.base import BaseAdapter, AssetData
 from services.icons import IconResolver
 from models.assets import AssetType
 from core.utils.retries import exchange_retry
 from services.deduplication import BinanceDetailsDeduplicator
+from services.ticker_cache import TickerCache
+from core.redis import get_redis_client
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +38,143 @@ IconResolver.register_strategy(
 )
 
 
+_WALLET_TYPES = ("spot", "future", "delivery", "funding")
+# Futures wallets are usually empty, so they are only queried when the wallet overview shows
+# a balance; spot and funding are always queried. Keys are /sapi/v1/asset/wallet/balance walletNames.
+_OPTIONAL_WALLET_NAMES = {"future": "USDⓈ-M Futures", "delivery": "COIN-M Futures"}
+_STAKING_PRODUCTS = ("STAKING", "L_DEFI", "F_DEFI")
+# Quote currencies used to price assets, in order of preference
+_PRICE_QUOTES = ("USDT", "USDC", "BUSD", "FDUSD", "EUR", "USD")
+# Valued at 1.0 without a ticker lookup
+_USD_PEGGED = frozenset({"USDT", "USDC", "BUSD", "DAI", "FDUSD", "USD", "USDS", "USDP", "BNFCR"})
+
+BalanceEntries = List[Tuple[str, str, float]]  # (symbol, source label, amount)
+
+
+# Binance request weight is limited per IP, while ccxt's limiter only paces one exchange
+# instance (one sync); cap concurrent REST calls across all syncs in the process instead
+_MAX_CONCURRENT_REQUESTS = 8
+_RATE_LIMIT_RETRIES = 4
+_RATE_LIMIT_BACKOFF_SEC = 0.5
+_request_slots: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = WeakKeyDictionary()
+
+
+async def _call(method, *args):
+    """One Binance REST call: bounded per process, retried with jittered backoff when rate limited."""
+    loop = asyncio.get_running_loop()
+    slots = _request_slots.get(loop)
+    if slots is None:
+        slots = _request_slots[loop] = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+
+    for attempt in range(_RATE_LIMIT_RETRIES):
+        async with slots:
+            try:
+                return await method(*args)
+            except (ccxt_async.DDoSProtection, ccxt_async.RateLimitExceeded):
+                if attempt == _RATE_LIMIT_RETRIES - 1:
+                    raise
+        # Full jitter, outside the semaphore: syncs throttled together don't retry in lockstep
+        await asyncio.sleep(random.uniform(0, _RATE_LIMIT_BACKOFF_SEC * 2**attempt))
+
+
+def _strip_ld(symbol: str) -> str:
+    """'LD' prefix marks assets visible in Spot view that actually belong to Flexible Earn."""
+    return symbol[2:] if symbol.startswith("LD") else symbol
+
+
+# Phase 1: Standard Wallets (Spot, Future, Delivery, Funding)
+async def _fetch_wallet(exchange, wallet_type: str) -> BalanceEntries:
+    params = {"type": wallet_type} if wallet_type != "spot" else {}
+    balance_data = await _call(exchange.fetch_balance, params)
+    # The response lists every currency the wallet has ever seen; keep only held ones
+    return [
+        (_strip_ld(symbol), f"{wallet_type}-{symbol}", amount)
+        for symbol, amount in balance_data.get("total", {}).items()
+        if amount
+    ]
+
+
+async def _active_wallet_types(exchange) -> Tuple[str, ...]:
+    """Wallet types worth querying, using one universal wallet balance call to skip empty futures wallets.
+
+    Falls back to every wallet type if the endpoint is unavailable.
+    """
+    try:
+        # Balances are quoted in USDT: the default BTC quote rounds a few dollars down to 0.00000000
+        wallets = await _call(exchange.sapi_get_asset_wallet_balance, {"quoteAsset": "USDT"})
+    except Exception as e:
+        logger.debug(f"Could not fetch wallet overview, querying all wallets: {e}")
+        return _WALLET_TYPES
+    totals = {wallet.get("walletName"): float(wallet.get("balance") or 0) for wallet in wallets}
+    # A wallet missing from the overview is queried anyway rather than silently dropped
+    return tuple(
+        wt
+        for wt in _WALLET_TYPES
+        if wt not in _OPTIONAL_WALLET_NAMES or totals.get(_OPTIONAL_WALLET_NAMES[wt], 1.0) != 0
+    )
+
+
+async def _fetch_wallets(exchange) -> BalanceEntries:
+    wallet_types = await _active_wallet_types(exchange)
+    results = await asyncio.gather(
+        *(_guarded(f"Binance {wt} balance", _fetch_wallet(exchange, wt)) for wt in wallet_types)
+    )
+    return [entry for entries in results if entries for entry in entries]
+
+
+# 2. Simple Earn (Flexible)
+async def _fetch_flexible_earn(exchange) -> BalanceEntries:
+    data = await _call(exchange.sapi_get_simple_earn_flexible_position, {"size": 100})
+    return [
+        (_strip_ld(row["asset"]), "SimpleEarn-Flexible", float(row.get("totalAmount") or 0))
+        for row in data.get("rows", [])
+    ]
+
+
+# 3. Simple Earn (Locked)
+async def _fetch_locked_earn(exchange) -> BalanceEntries:
+    data = await _call(exchange.sapi_get_simple_earn_locked_position, {"size": 100})
+    return [
+        (_strip_ld(row["asset"]), "SimpleEarn-Locked", float(row.get("amount") or row.get("totalAmount") or 0))
+        for row in data.get("rows", [])
+    ]
+
+
+# 4. Staking / DeFi / Savings (Exhaustive search)
+async def _fetch_staking(exchange, product_type: str) -> BalanceEntries:
+    rows = await _call(exchange.sapi_get_staking_position, {"product": product_type, "size": 100})
+    return [(_strip_ld(row["asset"]), f"Staking-{product_type}", float(row.get("amount") or 0)) for row in rows]
+
+
+# 5. BNB Vault & Margin
+async def _fetch_bnb_vault(exchange) -> BalanceEntries:
+    vault = await _call(exchange.sapi_get_bnb_vault_account)
+    return [("BNB", "BNB-Vault", float(vault.get("totalAmount") or 0))]
+
+
+async def _fetch_cross_margin(exchange) -> BalanceEntries:
+    margin = await _call(exchange.sapi_get_margin_account)
+    return [(info["asset"], "Cross-Margin", float(info["netAsset"])) for info in margin.get("userAssets", [])]
+
+
+# 6. Direct Funding Assets
+async def _fetch_funding_assets(exchange) -> BalanceEntries:
+    funding = await _call(exchange.sapi_post_asset_get_funding_asset)
+    return [
+        (item["asset"], "Funding-Direct", float(item["free"]) + float(item["freeze"]) + float(item["withdrawing"]))
+        for item in funding
+    ]
+
+
+async def _guarded(source: str, fetch, log_level: int = logging.WARNING) -> Optional[BalanceEntries]:
+    """Awaits one source fetch; logs and returns None if the source is unavailable."""
+    try:
+        return await fetch
+    except Exception as e:
+        logger.log(log_level, f"Could not fetch {source}: {e}")
+        return None
+
+
 class BinanceAdapter(BaseAdapter):
     """Adapter for Binance Exchange.
 
@@ -51,16 +192,15 @@ class BinanceAdapter(BaseAdapter):
         api_key = credentials.get("api_key")
         api_secret = credentials.get("api_secret")
 
+        exchange = ccxt_async.binance({"apiKey": api_key, "secret": api_secret, "enableRateLimit": True})
         try:
-            exchange = ccxt.binance({"apiKey": api_key, "secret": api_secret, "enableRateLimit": True})
-            # ccxt.binance uses blocking calls by default; we wrap them in an executor
-            # to keep the event loop responsive.
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, exchange.fetch_balance)
+            await exchange.fetch_balance()
             return True
         except Exception as e:
             logger.error(f"Binance validation failed: {e}")
             return False
+        finally:
+            await exchange.close()
 
     @exchange_retry()
     async def fetch_balances(
@@ -73,111 +213,53 @@ class BinanceAdapter(BaseAdapter):
         api_key = credentials.get("api_key")
         api_secret = credentials.get("api_secret")
 
-        exchange = ccxt.binance({"apiKey": api_key, "secret": api_secret, "enableRateLimit": True})
+        exchange = ccxt_async.binance({"apiKey": api_key, "secret": api_secret, "enableRateLimit": True})
+        try:
+            await TickerCache.prepare_markets(exchange)
+        except Exception:
+            await exchange.close()
+            raise
 
-        wallet_types = ["spot", "future", "delivery", "funding"]
-        loop = asyncio.get_event_loop()
+        # All sources are independent: request them (and the tickers) concurrently.
+        sources = {
+            "Binance wallets": _fetch_wallets(exchange),
+            "SimpleEarn-Flexible": _fetch_flexible_earn(exchange),
+            "SimpleEarn-Locked": _fetch_locked_earn(exchange),
+            **{f"Staking-{product}": _fetch_staking(exchange, product) for product in _STAKING_PRODUCTS},
+            "BNB-Vault": _fetch_bnb_vault(exchange),
+            "Cross-Margin": _fetch_cross_margin(exchange),
+            "Funding-Direct": _fetch_funding_assets(exchange),
+        }
+        # Most accounts have no staking products or BNB Vault; those failures are expected
+        quiet = {*(f"Staking-{product}" for product in _STAKING_PRODUCTS), "BNB-Vault"}
+        try:
+            quote_prices, *source_results = await asyncio.gather(
+                TickerCache.get_quote_prices(
+                    get_redis_client(), exchange.id, lambda: _call(exchange.fetch_tickers), _PRICE_QUOTES
+                ),
+                *(
+                    _guarded(name, fetch, logging.DEBUG if name in quiet else logging.WARNING)
+                    for name, fetch in sources.items()
+                ),
+            )
+        finally:
+            await exchange.close()
 
         # detailed_balances: symbol -> {source: amount}
         # This structure allows us to see exactly where Binance reports each asset.
         detailed_balances = {}
         skipped_sources = []
 
-        def add_balance(symbol, source, amount):
-            if abs(amount) < 1e-12:
-                return
-            if symbol not in detailed_balances:
-                detailed_balances[symbol] = {}
-            detailed_balances[symbol][source] = detailed_balances[symbol].get(source, 0.0) + amount
-
-        # Phase 1: Standard Wallets (Spot, Future, Delivery, Funding)
-        for wallet_type in wallet_types:
-            try:
-                params = {"type": wallet_type} if wallet_type != "spot" else {}
-                balance_data = await loop.run_in_executor(None, lambda: exchange.fetch_balance(params))
-                total_data = balance_data.get("total", {})
-                for symbol, amount in total_data.items():
-                    # 'LD' prefix handles assets visible in Spot view that actually belong to Flexible Earn
-                    normalized_symbol = symbol[2:] if symbol.startswith("LD") else symbol
-                    add_balance(normalized_symbol, f"{wallet_type}-{symbol}", amount)
-            except Exception as e:
-                logger.warning(f"Could not fetch Binance {wallet_type} balance: {e}")
-
-        # 2. Simple Earn (Flexible)
-        try:
-            flexible_earn_data = await loop.run_in_executor(
-                None,
-                lambda: exchange.sapi_get_simple_earn_flexible_position({"size": 100}),
-            )
-            for row in flexible_earn_data.get("rows", []):
-                symbol = row["asset"]
-                amount = float(row.get("totalAmount") or 0)
-                normalized_symbol = symbol[2:] if symbol.startswith("LD") else symbol
-                add_balance(normalized_symbol, "SimpleEarn-Flexible", amount)
-        except Exception as e:
-            logger.warning(f"Could not fetch Simple Earn Flexible: {e}")
-            skipped_sources.append("SimpleEarn-Flexible")
-
-        # 3. Simple Earn (Locked)
-        try:
-            locked_earn = await loop.run_in_executor(
-                None,
-                lambda: exchange.sapi_get_simple_earn_locked_position({"size": 100}),
-            )
-            for row in locked_earn.get("rows", []):
-                symbol = row["asset"]
-                amount = float(row.get("amount") or row.get("totalAmount") or 0)
-                norm_symbol = symbol[2:] if symbol.startswith("LD") else symbol
-                add_balance(norm_symbol, "SimpleEarn-Locked", amount)
-        except Exception as e:
-            logger.warning(f"Could not fetch Simple Earn Locked: {e}")
-            skipped_sources.append("SimpleEarn-Locked")
-
-        # 4. Staking / DeFi / Savings (Exhaustive search)
-        for product_type in ["STAKING", "L_DEFI", "F_DEFI"]:
-            try:
-                staking_positions = await loop.run_in_executor(
-                    None,
-                    lambda: exchange.sapi_get_staking_position({"product": product_type, "size": 100}),
-                )
-                for row in staking_positions:
-                    symbol = row["asset"]
-                    amount = float(row.get("amount") or 0)
-                    normalized_symbol = symbol[2:] if symbol.startswith("LD") else symbol
-                    add_balance(normalized_symbol, f"Staking-{product_type}", amount)
-            except Exception as e:
-                logger.debug(f"Could not fetch Staking ({product_type}): {e}")
-                skipped_sources.append(f"Staking-{product_type}")
-
-        # 5. BNB Vault & Margin
-        try:
-            vault = await loop.run_in_executor(None, exchange.sapi_get_bnb_vault_account)
-            amount = float(vault.get("totalAmount") or 0)
-            add_balance("BNB", "BNB-Vault", amount)
-        except Exception as e:
-            logger.debug(f"Could not fetch BNB Vault: {e}")
-            skipped_sources.append("BNB-Vault")
-
-        try:
-            margin = await loop.run_in_executor(None, exchange.sapi_get_margin_account)
-            for asset_info in margin.get("userAssets", []):
-                asset = asset_info["asset"]
-                net_amount = float(asset_info["netAsset"])
-                add_balance(asset, "Cross-Margin", net_amount)
-        except Exception as e:
-            logger.warning(f"Could not fetch Margin account: {e}")
-            skipped_sources.append("Cross-Margin")
-
-        # 6. Direct Funding Assets
-        try:
-            funding = await loop.run_in_executor(None, exchange.sapi_post_asset_get_funding_asset)
-            for item in funding:
-                asset = item["asset"]
-                amount = float(item["free"]) + float(item["freeze"]) + float(item["withdrawing"])
-                add_balance(asset, "Funding-Direct", amount)
-        except Exception as e:
-            logger.warning(f"Could not fetch Funding assets: {e}")
-            skipped_sources.append("Funding-Direct")
+        for name, entries in zip(sources, source_results):
+            if entries is None:
+                if not name.startswith("Binance "):
+                    skipped_sources.append(name)
+                continue
+            for symbol, entry_source, amount in entries:
+                if abs(amount) < 1e-12:
+                    continue
+                by_source = detailed_balances.setdefault(symbol, {})
+                by_source[entry_source] = by_source.get(entry_source, 0.0) + amount
 
         # Phase 6: Deduplication logic
         # Using the dedicated service to consolidate balances from multiple sources
@@ -187,35 +269,16 @@ class BinanceAdapter(BaseAdapter):
         if skipped_sources:
             logger.debug(f"Binance sync completed with {len(skipped_sources)} skipped sources: {skipped_sources}")
 
-        # Fetch Tickers
-        tickers = await loop.run_in_executor(None, exchange.fetch_tickers)
-
         assets = []
         for symbol, amount in final_balances.items():
             price = 0.0
             change_24h = 0.0
-            if symbol in [
-                "USDT",
-                "USDC",
-                "BUSD",
-                "DAI",
-                "FDUSD",
-                "USD",
-                "USDS",
-                "USDP",
-                "BNFCR",
-            ]:
+            if symbol in _USD_PEGGED:
                 price = 1.0
-            else:
-                for quote in ["USDT", "USDC", "BUSD", "FDUSD", "EUR", "USD"]:
-                    pair = f"{symbol}/{quote}"
-                    if pair in tickers:
-                        price = tickers[pair]["last"]
-                        change_24h = tickers[pair].get("percentage", 0.0)
-                        # If the quote is EUR, convert back to USD?
-                        # Actually, tickers are usually in the quote currency.
-                        # But Binance crypto pairs are mostly against stables.
-                        break
+            elif symbol in quote_prices:
+                # Tickers are in the quote currency, but Binance crypto pairs are mostly against stables
+                price = quote_prices[symbol]["last"]
+                change_24h = quote_prices[symbol].get("percentage", 0.0)
 
             assets.append(
                 AssetData(
@@ -10,6 +10,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Valued at 1.0 without a ticker lookup
+_USD_PEGGED = frozenset({"USDT", "USDC", "DAI", "FDUSD", "USD"})
+
 
 class BybitAdapter(BaseAdapter):
     def get_provider_id(self) -> str:
@@ -76,7 +79,7 @@ class BybitAdapter(BaseAdapter):
             change_24h = 0.0
 
             # Pricing logic
-            if symbol in ["USDT", "USDC", "DAI", "FDUSD", "USD"]:
+            if symbol in _USD_PEGGED:
                 price = 1.0
             else:
                 pair = f"{symbol}/USDT"
@@ -17,9 +17,24 @@ class AdapterFactory:
         ProviderID.bybit: BybitAdapter,
     }
 
+    # Adapters hold no per-user state, so one instance per provider is shared (per process)
+    _instances: Dict[ProviderID, BaseAdapter] = {}
+
     @classmethod
     def get_adapter(cls, provider_id: ProviderID) -> BaseAdapter:
+        adapter = cls._instances.get(provider_id)
+        if adapter is not None:
+            return adapter
         adapter_class = cls._adapters.get(provider_id)
         if not adapter_class:
             raise ValueError(f"No adapter found for provider: {provider_id}")
-        return adapter_class()
+        adapter = cls._instances[provider_id] = adapter_class()
+        return adapter
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Closes connections held by cached adapters; call before the event loop shuts down."""
+        adapters = list(cls._instances.values())
+        cls._instances.clear()
+        for adapter in adapters:
+            await adapter.close()
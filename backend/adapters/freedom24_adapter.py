@@ -18,9 +18,24 @@ class Freedom24Adapter(BaseAdapter):
     Uses API V2 with header-based signing for compatibility with European accounts.
     """
 
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+
     def get_provider_id(self) -> str:
         return "freedom24"
 
+    def _get_client(self) -> httpx.AsyncClient:
+        # Shared across syncs so consecutive requests reuse the keep-alive TLS connection
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=30.0, limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60.0)
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+
     async def _make_request(
         self,
         credentials: Dict[str, Any],
@@ -49,19 +64,18 @@ class Freedom24Adapter(BaseAdapter):
             "Content-Type": "application/x-www-form-urlencoded",
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(url, data=body_dict, headers=headers, timeout=30.0)
-                logger.debug(f"Freedom24 Request [{cmd}] Status: {response.status_code}")
+        try:
+            response = await self._get_client().post(url, data=body_dict, headers=headers)
+            logger.debug(f"Freedom24 Request [{cmd}] Status: {response.status_code}")
 
-                if response.status_code != 200:
-                    logger.error(f"Freedom24 API Error {response.status_code}: {response.text}")
-                    return {"error": "HTTP Error", "errMsg": response.text}
+            if response.status_code != 200:
+                logger.error(f"Freedom24 API Error {response.status_code}: {response.text}")
+                return {"error": "HTTP Error", "errMsg": response.text}
 
-                return response.json()
-            except Exception as e:
-                logger.error(f"Freedom24 Request Failed: {e}")
-                return {"error": "Request Failed", "errMsg": str(e)}
+            return response.json()
+        except Exception as e:
+            logger.error(f"Freedom24 Request Failed: {e}")
+            return {"error": "Request Failed", "errMsg": str(e)}
 
     async def validate_credentials(
         self, credentials: Dict[str, Any], settings: Optional[Dict[str, Any]] = None
@@ -1,9 +1,8 @@
 """Trading212 Adapter — Implementation for Trading212 brokerage API."""
 
-import asyncio
 from typing import List, Dict, Any, Optional
 from adapters.base import BaseAdapter, AssetData
-from services.trading212 import Trading212Client
+from services.trading212 import Trading212Client, close_shared_client
 from services.icons import IconResolver
 from models.assets import AssetType
 import logging
@@ -17,6 +16,9 @@ class Trading212Adapter(BaseAdapter):
     def get_provider_id(self) -> str:
         return "trading212"
 
+    async def close(self) -> None:
+        await close_shared_client()
+
     async def validate_credentials(
         self, credentials: Dict[str, Any], settings: Optional[Dict[str, Any]] = None
     ) -> bool:
@@ -24,12 +26,9 @@ class Trading212Adapter(BaseAdapter):
         api_secret = credentials.get("api_secret")
         is_demo = settings.get("is_demo", False) if settings else False
 
-        client = Trading212Client(api_key=api_key, api_secret=api_secret, is_demo=is_demo)
-        try:
+        async with Trading212Client(api_key=api_key, api_secret=api_secret, is_demo=is_demo) as client:
             result = await client.validate_keys()
             return result.get("valid", False)
-        finally:
-            await client.close()
 
     async def fetch_balances(
         self, credentials: Dict[str, Any], settings: Optional[Dict[str, Any]] = None
@@ -51,18 +50,17 @@ class Trading212Adapter(BaseAdapter):
         )
 
         try:
-            # 1. Get Account Info (Currency)
+            # Cash, account info (currency), instruments and positions are independent
             try:
-                account_meta = await client.get_account_metadata()
+                cash_data, account_meta, instruments_raw, positions = await client.fetch_all()
             except Exception as e:
-                logger.error(f"Failed to fetch account metadata: {e}")
+                logger.error(f"Failed to fetch Trading212 account data: {e}")
                 raise
 
+            # 1. Account currency
             account_currency = account_meta.get("currencyCode", "USD")
-            await asyncio.sleep(1.0)  # Rate limit politeness
 
             # 2. Cash
-            cash_data = await client.get_account_cash()
             free_cash = float(cash_data.get("free", 0.0))
             pie_cash = float(cash_data.get("pieCash", 0.0))
             blocked_cash = float(cash_data.get("blocked", 0.0))
@@ -84,10 +82,6 @@ class Trading212Adapter(BaseAdapter):
                 )
 
             # 3. Positions
-            positions = await client.get_open_positions()
-            await asyncio.sleep(1.0)  # Rate limit politeness
-
-            instruments_raw = await client.get_instruments()
             instruments = {i.get("ticker"): i for i in instruments_raw}
 
             for position in positions:
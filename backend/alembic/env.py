@@ -15,6 +15,7 @@ from models.integration import Integration  # noqa: F401
 from models.assets import UnifiedAsset  # noqa: F401
 from models.assets import PortfolioSnapshot  # noqa: F401
 from models.assets import PortfolioAggregate  # noqa: F401
+from models.assets import UserPortfolioTotal  # noqa: F401
 from models.assets import MarketPriceHistory  # noqa: F401
 from models.market_data import HistoricalCandle  # noqa: F401
 from models.analytics_result import AnalyticsResult  # noqa: F401
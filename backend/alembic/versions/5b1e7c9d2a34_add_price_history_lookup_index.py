@@ -0,0 +1,42 @@
+"""Add composite lookup index to market_price_history
+
+Revision ID: 5b1e7c9d2a34
+Revises: 24691d2b4cc7
+Create Date: 2026-10-16 09:12:41.507316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e7c9d2a34'
+down_revision: Union[str, Sequence[str], None] = '24691d2b4cc7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_market_price_history_symbol_provider_ts',
+            'market_price_history',
+            ['symbol', 'provider_id', 'timestamp'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_market_price_history_symbol_provider_ts',
+            table_name='market_price_history',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,59 @@
+"""Add covering snapshot lookup index and partial active-integration index
+
+Revision ID: 7c2d4e8f1a90
+Revises: 5b1e7c9d2a34
+Create Date: 2026-10-16 11:03:27.184522
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2d4e8f1a90'
+down_revision: Union[str, Sequence[str], None] = '5b1e7c9d2a34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_snapshot_user_ts_desc',
+            'portfolio_snapshots',
+            ['user_id', sa.text('timestamp DESC')],
+            unique=False,
+            postgresql_include=['id', 'total_value_usd'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_integration_user_active',
+            'integrations',
+            ['user_id'],
+            unique=False,
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_integration_user_active',
+            table_name='integrations',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_snapshot_user_ts_desc',
+            table_name='portfolio_snapshots',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
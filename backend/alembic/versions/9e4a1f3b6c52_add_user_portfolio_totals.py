@@ -0,0 +1,40 @@
+"""Add user_portfolio_totals
+
+Revision ID: 9e4a1f3b6c52
+Revises: 7c2d4e8f1a90
+Create Date: 2026-10-16 13:27:05.913448
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4a1f3b6c52'
+down_revision: Union[str, Sequence[str], None] = '7c2d4e8f1a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'user_portfolio_totals',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('total_usd', sa.Numeric(precision=30, scale=8), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+    # Backfill from the current asset rows
+    op.execute(
+        "INSERT INTO user_portfolio_totals (user_id, total_usd) "
+        "SELECT user_id, sum(usd_value) FROM unified_assets GROUP BY user_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_portfolio_totals')
@@ -0,0 +1,43 @@
+"""Add covering (user_id, integration_id) INCLUDE (usd_value) index on unified_assets
+
+Revision ID: b3f8d2a6e1c7
+Revises: 9e4a1f3b6c52
+Create Date: 2026-10-16 18:42:11.604219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f8d2a6e1c7'
+down_revision: Union[str, Sequence[str], None] = '9e4a1f3b6c52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_unified_assets_user_integration_usd',
+            'unified_assets',
+            ['user_id', 'integration_id'],
+            unique=False,
+            postgresql_include=['usd_value'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_unified_assets_user_integration_usd',
+            table_name='unified_assets',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
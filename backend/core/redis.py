@@ -17,7 +17,19 @@ def get_redis_client() -> redis.Redis:
     """
     loop = asyncio.get_event_loop()
     if loop not in _client_cache:
-        _client_cache[loop] = redis.from_url(settings.REDIS_URL, encoding="utf-8", decode_responses=True)
+        # Bounded pool: under lock-heavy load callers queue for a free connection
+        # instead of all contending on the default pool's connection setup.
+        pool = redis.BlockingConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT_SEC,
+            encoding="utf-8",
+            decode_responses=True,
+            # Worker pools live for the whole process: probe idle connections and keep them alive
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL_SEC,
+            socket_keepalive=True,
+        )
+        _client_cache[loop] = redis.Redis(connection_pool=pool)
     return _client_cache[loop]
 
 
@@ -27,6 +39,6 @@ async def close_redis_client():
     if loop in _client_cache:
         client = _client_cache.pop(loop)
         if hasattr(client, "aclose"):
-            await client.aclose()
+            await client.aclose(close_connection_pool=True)
         elif hasattr(client, "close"):
-            await client.close()
+            await client.close(close_connection_pool=True)
@@ -4,7 +4,7 @@ import logging
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
     retry_if_exception_type,
     before_sleep_log,
 )
@@ -51,7 +51,8 @@ def exchange_retry(
             )
         ),  # Explicitly listed for clarity, though custom func works too
         stop=stop_after_attempt(max_attempts),
-        wait=wait_exponential(multiplier=1, min=min_wait, max=max_wait),
+        # Jittered, so adapters throttled at the same moment don't retry in lockstep
+        wait=wait_random_exponential(multiplier=1, min=min_wait, max=max_wait),
         before_sleep=before_sleep_log(logger, logging.WARNING),
         reraise=True,
     )
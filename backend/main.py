@@ -1,11 +1,14 @@
 """Main entry point for the QuantPulse FastAPI application."""
 
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import redis.asyncio as redis
 from fastapi_limiter import FastAPILimiter
 from core.config import settings
+from core.database import log_pool_status
 from core.logging_config import setup_logging
 from routers import auth, dashboard, integrations, users, analytics
 
@@ -18,7 +21,9 @@ async def lifespan(app: FastAPI):
     # Initialize rate limiter
     r = redis.from_url(settings.REDIS_URL, encoding="utf-8", decode_responses=True)
     await FastAPILimiter.init(r)
+    pool_monitor = asyncio.create_task(log_pool_status())
     yield
+    pool_monitor.cancel()
     await r.close()
 
 
@@ -9,6 +9,7 @@ from sqlalchemy import (
     Enum,
     Numeric,
     JSON,
+    Index,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
@@ -47,16 +48,45 @@ class UnifiedAsset(Base):
         nullable=False,
     )
 
+    # Index-only scans for the per-user total refresh and the synced-integrations lookup
+    __table_args__ = (
+        Index(
+            "ix_unified_assets_user_integration_usd",
+            user_id,
+            integration_id,
+            postgresql_include=["usd_value"],
+        ),
+    )
+
 
 class PortfolioSnapshot(Base):
     __tablename__ = "portfolio_snapshots"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    timestamp = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     total_value_usd = Column(Numeric(precision=30, scale=8), nullable=False)
     data = Column(JSON, nullable=True)  # Store breakdown or metadata if needed
 
+    __table_args__ = (
+        Index(
+            "ix_snapshot_user_ts_desc",
+            user_id,
+            timestamp.desc(),
+            postgresql_include=["id", "total_value_usd"],
+        ),
+    )
+
+
+class UserPortfolioTotal(Base):
+    """Per-user sum of unified_assets.usd_value, refreshed whenever a user's assets are rewritten."""
+
+    __tablename__ = "user_portfolio_totals"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    total_usd = Column(Numeric(precision=30, scale=8), nullable=True)  # NULL when the user has no assets
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
 
 class PortfolioAggregate(Base):
     __tablename__ = "portfolio_aggregates"
@@ -76,3 +106,6 @@ class MarketPriceHistory(Base):
     price = Column(Numeric(precision=30, scale=8), nullable=False)
     currency = Column(String, nullable=False, default="USD")
     timestamp = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+
+    # Serves the per-asset "latest before X" / "oldest" lookups of PriceTrackingService
+    __table_args__ = (Index("ix_market_price_history_symbol_provider_ts", "symbol", "provider_id", "timestamp"),)
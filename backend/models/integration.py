@@ -1,6 +1,6 @@
 """Database models for brokerage and exchange integrations."""
 
-from sqlalchemy import Column, String, Boolean, ForeignKey, JSON, DateTime, Enum
+from sqlalchemy import Column, String, Boolean, ForeignKey, JSON, DateTime, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -27,3 +27,5 @@ class Integration(Base):
     is_active = Column(Boolean, default=True, nullable=False)
     settings = Column(JSON, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (Index("ix_integration_user_active", user_id, postgresql_where=is_active),)
@@ -117,14 +117,12 @@ async def get_sync_status(current_user: User = Depends(get_current_user)):
 
     sync_manager = SyncManager(redis_client)
 
-    remaining = await sync_manager.get_remaining_cooldown(current_user.id)
-    active_task = await sync_manager.get_active_task(current_user.id)
-    last_sync = await sync_manager.get_last_sync_time(current_user.id)
+    state = await sync_manager.get_sync_state(current_user.id)
 
     return {
-        "remaining_cooldown": remaining,
-        "active_task_id": active_task,
-        "last_sync_time": last_sync,
+        "remaining_cooldown": state.remaining_cooldown,
+        "active_task_id": state.active_task_id,
+        "last_sync_time": state.last_sync_time,
         "auto_sync_interval": SyncManager.AUTO_SYNC_INTERVAL,
     }
 
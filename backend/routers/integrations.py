@@ -3,22 +3,39 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-import json
+import asyncio
+import orjson
 
 from core.database import get_db
+from core.redis import get_redis_client
 from core.security.encryption import encryption_service
 from core.deps import get_current_user
 from models.integration import Integration
 from models.user import User
 from models.assets import UnifiedAsset
 from schemas.integration import IntegrationCreate, IntegrationResponse
+from services.snapshot_service import SnapshotService
 from worker.tasks import sync_integration_data
 
 router = APIRouter()
 
 
+def _find_integration_with_api_key(integrations: List[Integration], api_key: str) -> Optional[Integration]:
+    """Returns the integration whose stored credentials use `api_key`, if any."""
+    for existing in integrations:
+        try:
+            # Decrypt stored credentials
+            existing_creds = orjson.loads(encryption_service.decrypt(existing.credentials))
+        except Exception:
+            # If decryption fails for old/corrupt data, skip it safely
+            continue
+        if existing_creds.get("api_key") == api_key:
+            return existing
+    return None
+
+
 @router.get("/", response_model=List[IntegrationResponse])
 async def get_integrations(current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
     query = select(Integration).where(Integration.user_id == current_user.id)
@@ -39,21 +56,13 @@ async def create_integration(
 
     new_api_key = integration_in.credentials.get("api_key")
     if new_api_key:
-        for existing in existing_integrations:
-            try:
-                # Decrypt stored credentials
-                decrypted_json = encryption_service.decrypt(existing.credentials)
-                existing_creds = json.loads(decrypted_json)
-
-                # Compare API Keys
-                if existing_creds.get("api_key") == new_api_key:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"This API Key is already added as '{existing.name}'. Duplicate keys are not allowed.",
-                    )
-            except Exception:
-                # If decryption fails for old/corrupt data, skip it safely
-                continue
+        # Decrypting every stored credential is CPU work; keep it off the event loop
+        duplicate = await asyncio.to_thread(_find_integration_with_api_key, existing_integrations, new_api_key)
+        if duplicate is not None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"This API Key is already added as '{duplicate.name}'. Duplicate keys are not allowed.",
+            )
 
     # 1. Use Adapter to Validate
     from adapters.factory import AdapterFactory
@@ -74,7 +83,9 @@ async def create_integration(
         raise HTTPException(status_code=400, detail=f"Validation error: {str(e)}")
 
     # 3. Encrypt Credentials
-    encrypted_credentials = encryption_service.encrypt(json.dumps(integration_in.credentials))
+    encrypted_credentials = await asyncio.to_thread(
+        encryption_service.encrypt, orjson.dumps(integration_in.credentials).decode()
+    )
 
     # 4. Save
     new_integration = Integration(
@@ -88,6 +99,7 @@ async def create_integration(
     db.add(new_integration)
     await db.commit()
     await db.refresh(new_integration)
+    await SnapshotService.invalidate_completeness_cache(get_redis_client(), current_user.id)
 
     # Trigger background sync
     try:
@@ -114,6 +126,8 @@ async def delete_integration(
 
     # Delete associated assets first (Cascade manually)
     await db.execute(delete(UnifiedAsset).where(UnifiedAsset.integration_id == integration.id))
+    await SnapshotService.refresh_portfolio_total(db, current_user.id)
 
     await db.delete(integration)
     await db.commit()
+    await SnapshotService.invalidate_completeness_cache(get_redis_client(), current_user.id)
@@ -7,7 +7,7 @@ It uses 'USD' as the internal base currency for all cross-rate calculations.
 
 import httpx
 import logging
-from typing import Dict
+from typing import Dict, Iterable
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -26,14 +26,33 @@ class CurrencyService:
     @classmethod
     async def get_rate(cls, from_currency: str, to_currency: str = "USD") -> float:
         """Get exchange rate from one currency to another."""
-        from_up = from_currency.upper()
-        to_up = to_currency.upper()
-
-        if from_up == to_up:
+        if from_currency.upper() == to_currency.upper():
             return 1.0
 
         # Refresh rates if needed
         await cls._refresh_rates_if_needed()
+        return cls._lookup_rate(from_currency.upper(), to_currency.upper())
+
+    @classmethod
+    async def get_rates_bulk(cls, from_currencies: Iterable[str], to_currency: str = "USD") -> Dict[str, float]:
+        """Get exchange rates from several currencies to one target currency.
+
+        Refreshes the rate table at most once for the whole batch.
+
+        Returns:
+            Mapping keyed by the currency codes exactly as passed in.
+        """
+        to_up = to_currency.upper()
+        currencies = set(from_currencies)
+        # Identity pairs need no rate table: an all-USD batch never waits on a refresh
+        if any(curr.upper() != to_up for curr in currencies):
+            await cls._refresh_rates_if_needed()
+        return {curr: cls._lookup_rate(curr.upper(), to_up) for curr in currencies}
+
+    @classmethod
+    def _lookup_rate(cls, from_up: str, to_up: str) -> float:
+        if from_up == to_up:
+            return 1.0
 
         # Try direct rate
         if from_up == "USD" and to_up in cls._rates:
@@ -48,6 +67,14 @@ class CurrencyService:
 
         return 1.0
 
+    @classmethod
+    async def prefetch_rates(cls) -> None:
+        """Refreshes the rate table if it is stale so later lookups are served from memory.
+
+        Never raises, which makes it safe to run alongside other awaitables.
+        """
+        await cls._refresh_rates_if_needed()
+
     @classmethod
     async def _refresh_rates_if_needed(cls):
         if not cls._last_updated or (datetime.now() - cls._last_updated) > cls._update_interval:
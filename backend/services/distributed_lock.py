@@ -19,18 +19,41 @@ Usage:
             ... # critical section
 """
 
-import uuid
+import os
 import asyncio
+import itertools
 import logging
-from typing import Optional
+import secrets
+from typing import Dict, Optional, Tuple
 
 from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
+from sqlalchemy import func, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import settings
 
 logger = logging.getLogger(__name__)
 
 
+# Lock tokens only need to be unique among contenders, not unpredictable:
+# a random per-process prefix plus a counter avoids an os.urandom() call per acquire.
+_PROCESS_ID = secrets.token_hex(8)
+_token_counter = itertools.count()
+
+
+def _reseed_process_id() -> None:
+    """Gives forked workers (Celery prefork) their own token prefix."""
+    global _PROCESS_ID, _token_counter
+    _PROCESS_ID = secrets.token_hex(8)
+    _token_counter = itertools.count()
+
+
+os.register_at_fork(after_in_child=_reseed_process_id)
+
+
 # Lua script: Delete key ONLY if value matches our token.
 # This prevents a situation where Worker A releases Worker B's lock
 # because the TTL expired and B acquired the lock.
@@ -50,6 +73,19 @@ return 0
 """
 
 
+# Standalone script calls go out as EVALSHA; the body is only sent after a NOSCRIPT
+# (e.g. once per Redis restart). Pipelined calls keep plain EVAL: a pipeline holding
+# registered scripts first checks them with SCRIPT EXISTS, an extra round trip.
+_scripts: Dict[str, AsyncScript] = {}
+
+
+def _registered_script(redis_client: Redis, source: str) -> AsyncScript:
+    script = _scripts.get(source)
+    if script is None:
+        script = _scripts[source] = redis_client.register_script(source)
+    return script
+
+
 class DistributedLock:
     """Redis-based distributed lock with owner verification.
 
@@ -65,10 +101,12 @@ class DistributedLock:
     ):
         self._redis = redis_client
         self._key = f"dlock:{resource_name}"
+        self._channel_name = f"dlock:channel:{self._key}"
         effective_ttl = ttl_sec if ttl_sec is not None else settings.SYNC_LOCK_TTL_SEC
         self._ttl_ms = effective_ttl * 1000
         self._token: Optional[str] = None
         self._acquired = False
+        self._watchdog_task: Optional[asyncio.Task] = None
 
     @property
     def acquired(self) -> bool:
@@ -91,9 +129,9 @@ class DistributedLock:
         )
         # retry_interval_sec is now used only for fallback polling/jitter
 
-        self._token = str(uuid.uuid4())
-        deadline = asyncio.get_event_loop().time() + eff_timeout
-        channel_name = f"dlock:channel:{self._key}"
+        self._token = f"{_PROCESS_ID}:{next(_token_counter)}"
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + eff_timeout
 
         # 1. Optimistic first try
         if await self._try_acquire():
@@ -101,35 +139,32 @@ class DistributedLock:
 
         # 2. Wait with Pub/Sub
         pubsub = self._redis.pubsub()
-        await pubsub.subscribe(channel_name)
+        await pubsub.subscribe(self._channel_name)
 
         try:
-            while asyncio.get_event_loop().time() < deadline:
-                # Try to acquire
-                if await self._try_acquire():
+            while True:
+                # Contended path: SET NX and the holder's PTTL share one round trip
+                acquired, holder_ttl_ms = await self._try_acquire_probe()
+                if acquired:
                     return True
 
-                # Wait for notification or timeout
-                remaining = deadline - asyncio.get_event_loop().time()
-                if remaining <= 0:
-                    break
+                # Wait for a release notification, but no longer than the holder's
+                # remaining TTL: a lock that simply expires publishes nothing.
+                wake_at = deadline
+                if holder_ttl_ms > 0:
+                    wake_at = min(deadline, loop.time() + holder_ttl_ms / 1000)
 
-                # Wait for message with timeout
-                try:
-                    message = await pubsub.get_message(
+                remaining = wake_at - loop.time()
+                if remaining > 0:
+                    # get_message's own timeout returns None instead of tearing down the connection
+                    await pubsub.get_message(
                         ignore_subscribe_messages=True, timeout=remaining
                     )
-                    if message:
-                        # Someone released the lock, try to acquire immediately
-                        continue
-                except asyncio.TimeoutError:
+                if loop.time() >= deadline:
                     break
 
-                # Small sleep to prevent tight loop if pubsub fails or spurious wakeups
-                await asyncio.sleep(0.05)
-
         finally:
-            await pubsub.unsubscribe(channel_name)
+            await pubsub.unsubscribe(self._channel_name)
             await pubsub.close()
 
         logger.warning(f"Lock acquire timeout: {self._key} after {eff_timeout}s")
@@ -150,28 +185,36 @@ class DistributedLock:
             return True
         return False
 
+    async def _try_acquire_probe(self) -> Tuple[bool, int]:
+        """SET NX PX pipelined with a PTTL of the current holder.
+
+        Returns:
+            (acquired, holder_ttl_ms); the TTL is negative if the key had none.
+        """
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.pttl(self._key)
+            pipe.set(self._key, self._token, nx=True, px=self._ttl_ms)
+            holder_ttl_ms, result = await pipe.execute()
+
+        if result:
+            self._acquired = True
+            logger.debug(f"Lock acquired: {self._key}")
+            return True, 0
+        return False, holder_ttl_ms
+
     async def release(self) -> bool:
         """Releases the lock and notifies waiters via Pub/Sub."""
         if not self._token:
             return False
 
-        # Release Script + Publish Notification
-        # KEYS[1] = lock_key, ARGV[1] = token, ARGV[2] = channel_name
-        _RELEASE_PUBLISH_SCRIPT = """
-        if redis.call("GET", KEYS[1]) == ARGV[1] then
-            local del_res = redis.call("DEL", KEYS[1])
-            if del_res == 1 then
-                redis.call("PUBLISH", ARGV[2], "RELEASED")
-            end
-            return del_res
-        end
-        return 0
-        """
+        self._stop_watchdog()
 
-        channel_name = f"dlock:channel:{self._key}"
-        result = await self._redis.eval(
-            _RELEASE_PUBLISH_SCRIPT, 1, self._key, self._token, channel_name
-        )
+        # Owner-checked DEL and the waiter notification travel in one round trip.
+        # PUBLISH is unconditional: a spurious wake-up only costs waiters one SET NX retry.
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.eval(_RELEASE_SCRIPT, 1, self._key, self._token)
+            pipe.publish(self._channel_name, "R")
+            result, _ = await pipe.execute()
 
         released = bool(result)
         if released:
@@ -192,22 +235,44 @@ class DistributedLock:
             return False
 
         additional_ms = additional_sec * 1000
-        result = self._redis.eval(
-            _EXTEND_SCRIPT,
-            1,
-            self._key,
-            self._token,
-            str(additional_ms),
+        result = await _registered_script(self._redis, _EXTEND_SCRIPT)(
+            keys=[self._key], args=[self._token, str(additional_ms)], client=self._redis
         )
         extended = bool(result)
         if extended:
             logger.debug(f"Lock extended by {additional_sec}s: {self._key}")
         return extended
 
+    def start_watchdog(self) -> None:
+        """Keeps refreshing the TTL in the background until release().
+
+        Lets a critical section run longer than the lock TTL while its holder
+        is alive; if the holder dies, the lock still expires on its own.
+        """
+        if self._acquired and self._watchdog_task is None:
+            self._watchdog_task = asyncio.create_task(self._watchdog())
+
+    async def _watchdog(self) -> None:
+        interval_sec = self._ttl_ms / 3000
+        while self._acquired:
+            await asyncio.sleep(interval_sec)
+            try:
+                if not await self.extend(self._ttl_ms // 1000):
+                    logger.warning(f"Lock lost while held (watchdog could not extend): {self._key}")
+                    return
+            except RedisError as e:
+                logger.warning(f"Lock watchdog extend failed for {self._key}: {e}")
+
+    def _stop_watchdog(self) -> None:
+        if self._watchdog_task is not None:
+            self._watchdog_task.cancel()
+            self._watchdog_task = None
+
     # --- Context Manager ---
 
     async def __aenter__(self) -> "DistributedLock":
-        await self.acquire()
+        if await self.acquire():
+            self.start_watchdog()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -215,6 +280,14 @@ class DistributedLock:
             await self.release()
 
 
+async def release_if_owner(redis_client: Redis, key: str, token: str) -> bool:
+    """Deletes `key` only while it still holds `token` (owner-tagged markers outside DistributedLock)."""
+    result = await _registered_script(redis_client, _RELEASE_SCRIPT)(
+        keys=[key], args=[token], client=redis_client
+    )
+    return bool(result)
+
+
 class LockManager:
     """Factory for creating named DistributedLocks.
 
@@ -226,21 +299,47 @@ class LockManager:
         self._redis = redis_client
 
     def sync_lock(
-        self, user_id: int, integration_id: str, ttl_sec: Optional[int] = None
+        self, integration_id: str, ttl_sec: Optional[int] = None
     ) -> DistributedLock:
-        """Lock for syncing a specific integration."""
+        """Lock for syncing a specific integration (integration ids are globally unique)."""
         return DistributedLock(
             self._redis,
-            f"sync:{user_id}:{integration_id}",
+            f"sync:{integration_id}",
             ttl_sec=ttl_sec if ttl_sec is not None else settings.SYNC_LOCK_TTL_SEC,
         )
 
-    def snapshot_lock(
-        self, user_id: int, ttl_sec: Optional[int] = None
-    ) -> DistributedLock:
-        """Lock for creating a user's portfolio snapshot."""
-        return DistributedLock(
-            self._redis,
-            f"snapshot:{user_id}",
-            ttl_sec=ttl_sec if ttl_sec is not None else settings.SNAPSHOT_LOCK_TTL_SEC,
+
+# --- Postgres advisory locks ---
+# For critical sections that live inside one DB transaction: the lock is taken
+# by that transaction and released by its COMMIT/ROLLBACK, so it cannot leak.
+
+# First key of the two-int advisory lock form, one per lock kind
+SNAPSHOT_LOCK_NAMESPACE = 0x534E4150  # "SNAP"
+PORTFOLIO_TOTAL_LOCK_NAMESPACE = 0x544F544C  # "TOTL"
+
+_LOCK_NOT_AVAILABLE = "55P03"
+
+
+async def acquire_advisory_xact_lock(
+    db: AsyncSession, namespace: int, key: int, timeout_sec: float
+) -> bool:
+    """Waits up to `timeout_sec` for a transaction-scoped advisory lock.
+
+    Returns:
+        True once held (until the transaction ends); False on timeout, in
+        which case the transaction has been rolled back.
+    """
+    # set_config in the FROM clause runs before the lock call, in one round trip
+    timeout = select(
+        func.set_config("lock_timeout", f"{int(timeout_sec * 1000)}ms", True)
+    ).subquery()
+    try:
+        await db.execute(
+            select(func.pg_advisory_xact_lock(namespace, key)).select_from(timeout)
         )
+    except DBAPIError as e:
+        if getattr(e.orig, "sqlstate", None) != _LOCK_NOT_AVAILABLE:
+            raise
+        await db.rollback()
+        return False
+    return True
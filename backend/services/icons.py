@@ -1,9 +1,62 @@
 """Icon resolution service for providing professional asset imagery."""
 
 import re
+from functools import lru_cache
 from typing import Dict, Callable
 from models.assets import AssetType
 
+# Company name cleanup for URL patterns
+_PAREN_RE = re.compile(r"\(.*?\)")
+_SUFFIX_RE = re.compile(
+    r"\s+(inc|plc|class [a-z]|se|co|corp|technology|technologies|group|the|holdings|ltd|s\.p\.a\.|sa)\.?$"
+)
+_NONALNUM_RE = re.compile(r"[^a-z0-9\s-]")
+_DASH_RE = re.compile(r"-+")
+
+# Major Financial Brands and common parents, in match priority order
+_BRANDS = (
+    "vanguard",
+    "ishares",
+    "wisdomtree",
+    "invesco",
+    "amundi",
+    "lyxor",
+    "hsbc",
+    "spdr",
+    "jpmorgan",
+    "xtrackers",
+    "blackrock",
+    "fidelity",
+    "schwab",
+    "ark",
+    "21shares",
+    "coinshares",
+    "vaneck",
+    "alphabet",
+    "google",
+    "amazon",
+    "apple",
+    "microsoft",
+    "meta",
+    "netflix",
+    "nvidia",
+    "tesla",
+    "delivery-hero",
+)
+# Single native scan that reports every (possibly overlapping) brand occurrence: the lookahead
+# matches at each position, and alternation order makes it capture the highest-priority brand there.
+_BRAND_RE = re.compile("(?=(" + "|".join(map(re.escape, _BRANDS)) + "))")
+_BRAND_PRIORITY = {brand: i for i, brand in enumerate(_BRANDS)}
+_BRAND_ALIASES = {"google": "alphabet"}
+
+_CURRENCY_SYMBOLS = {
+    "USD": "$",
+    "EUR": "€",
+    "GBP": "£",
+    "JPY": "¥",
+    "CHF": "Fr",
+}
+
 
 class IconResolver:
     """Unified Icon Management System (Registry Pattern).
@@ -49,87 +102,44 @@ class IconResolver:
             except Exception:
                 pass
 
-        # 2. Universal Global Fallbacks
-        symbol_low = symbol.lower()
-        symbol_up = symbol.upper()
-        raw_name = (asset_name or "").lower()
+        # 2-3. Universal fallbacks are pure functions of their inputs
+        return _resolve_fallback_icon(symbol, asset_type, asset_name)
+
+
+@lru_cache(maxsize=8192)
+def _resolve_fallback_icon(symbol: str, asset_type: AssetType, asset_name: str = None) -> str:
+    """Universal fallback chain of `IconResolver.get_icon_url` (memoized)."""
+    symbol_low = symbol.lower()
+    symbol_up = symbol.upper()
+    raw_name = (asset_name or "").lower()
+
+    if asset_type == AssetType.FIAT:
+        char = _CURRENCY_SYMBOLS.get(symbol_up, symbol_up[:1])
+        return f"https://ui-avatars.com/api/?name={char}&background=2A2E39&color=fff&font-size=0.45&bold=true"
+
+    if asset_type == AssetType.CRYPTO:
+        return f"https://raw.githubusercontent.com/spothq/cryptocurrency-icons/master/128/color/{symbol_low}.png"
+
+    if asset_type == AssetType.STOCK:
+        # 2a. Brand mapping (Top priority for ETFs)
+        brand = min((m.group(1) for m in _BRAND_RE.finditer(raw_name)), key=_BRAND_PRIORITY.get, default=None)
+        if brand:
+            brand_id = _BRAND_ALIASES.get(brand, brand)
+            return f"https://s3-symbol-logo.tradingview.com/{brand_id}--big.svg"
 
-        # Clean company name for URL pattern
+        # 2b. Cleaned name lookup (High priority for common stocks)
         # Remove anything in parentheses, common corporate suffixes, and non-alphanumeric chars
-        name_clean = re.sub(r"\(.*?\)", "", raw_name)
-        name_clean = re.sub(
-            r"\s+(inc|plc|class [a-z]|se|co|corp|technology|technologies|group|the|holdings|ltd|s\.p\.a\.|sa)\.?$",
-            "",
-            name_clean.strip(),
-        )
-        name_clean = re.sub(r"[^a-z0-9\s-]", "", name_clean).strip().replace(" ", "-")
-        name_clean = re.sub(r"-+", "-", name_clean)  # Remove double hyphens
-
-        # Major Financial Brands and common parents
-        brands = [
-            "vanguard",
-            "ishares",
-            "wisdomtree",
-            "invesco",
-            "amundi",
-            "lyxor",
-            "hsbc",
-            "spdr",
-            "jpmorgan",
-            "xtrackers",
-            "blackrock",
-            "fidelity",
-            "schwab",
-            "ark",
-            "21shares",
-            "coinshares",
-            "vaneck",
-            "alphabet",
-            "google",
-            "amazon",
-            "apple",
-            "microsoft",
-            "meta",
-            "netflix",
-            "nvidia",
-            "tesla",
-            "delivery-hero",
-        ]
-
-        if asset_type == AssetType.FIAT:
-            currency_symbols = {
-                "USD": "$",
-                "EUR": "€",
-                "GBP": "£",
-                "JPY": "¥",
-                "CHF": "Fr",
-            }
-            char = currency_symbols.get(symbol_up, symbol_up[:1])
-            return f"https://ui-avatars.com/api/?name={char}&background=2A2E39&color=fff&font-size=0.45&bold=true"
-
-        if asset_type == AssetType.CRYPTO:
-            return f"https://raw.githubusercontent.com/spothq/cryptocurrency-icons/master/128/color/{symbol_low}.png"
-
-        if asset_type == AssetType.STOCK:
-            # 2a. Brand mapping (Top priority for ETFs)
-            for b in brands:
-                if b in raw_name:
-                    # Special case for brand variations
-                    brand_id = b
-                    if b in ["google", "alphabet"]:
-                        brand_id = "alphabet"
-                    if b == "delivery-hero":
-                        brand_id = "delivery-hero"
-                    return f"https://s3-symbol-logo.tradingview.com/{brand_id}--big.svg"
-
-            # 2b. Cleaned name lookup (High priority for common stocks)
-            if name_clean and len(name_clean) > 2:
-                return f"https://s3-symbol-logo.tradingview.com/{name_clean}--big.svg"
-
-            # 2c. Ticker lookup fallback
-            ticker_clean = symbol_low.split(".")[0].split(":")[0].split("_")[0]
-            return f"https://s3-symbol-logo.tradingview.com/{ticker_clean}--big.svg"
-
-        # 3. Final Fallback: Professional Uniform Placeholder
-        # Ensures a consistent, premium look across the board
-        return "/icons/generic_asset.png"
+        name_clean = _PAREN_RE.sub("", raw_name)
+        name_clean = _SUFFIX_RE.sub("", name_clean.strip())
+        name_clean = _NONALNUM_RE.sub("", name_clean).strip().replace(" ", "-")
+        name_clean = _DASH_RE.sub("-", name_clean)  # Remove double hyphens
+        if name_clean and len(name_clean) > 2:
+            return f"https://s3-symbol-logo.tradingview.com/{name_clean}--big.svg"
+
+        # 2c. Ticker lookup fallback
+        ticker_clean = symbol_low.split(".")[0].split(":")[0].split("_")[0]
+        return f"https://s3-symbol-logo.tradingview.com/{ticker_clean}--big.svg"
+
+    # 3. Final Fallback: Professional Uniform Placeholder
+    # Ensures a consistent, premium look across the board
+    return "/icons/generic_asset.png"
@@ -4,19 +4,39 @@ Handles fetching historical candle data from external providers (Yahoo Finance)
 and storing it in the database for analytics.
 """
 
+import asyncio
 import logging
 import yfinance as yf
 import pandas as pd
 from datetime import datetime, timezone
-from typing import List
+from typing import Dict, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.sql import func
 from models.market_data import HistoricalCandle
 
 logger = logging.getLogger(__name__)
 
+# Above this many rows the upsert goes through COPY + staging table instead of INSERT ... VALUES
+COPY_THRESHOLD = 1000
+
+_STAGING_TABLE = "historical_candles_staging"
+_CANDLE_COLUMNS = ("symbol", "timestamp", "open", "high", "low", "close", "volume")
+_UPSERT_FROM_STAGING = text(
+    f"""
+    INSERT INTO historical_candles ({", ".join(_CANDLE_COLUMNS)})
+    SELECT {", ".join(_CANDLE_COLUMNS)} FROM {_STAGING_TABLE}
+    ON CONFLICT (symbol, timestamp) DO UPDATE SET
+        open = EXCLUDED.open,
+        high = EXCLUDED.high,
+        low = EXCLUDED.low,
+        close = EXCLUDED.close,
+        volume = EXCLUDED.volume,
+        updated_at = now()
+    """
+)
+
 
 class MarketDataService:
     @staticmethod
@@ -33,65 +53,132 @@ class MarketDataService:
             Number of candles inserted/updated.
         """
         try:
-            # 1. Fetch from Yahoo Finance (Synchronous, but fast enough for background tasks)
-            # For heavy loads, run this in a threadpool executor.
-            ticker = yf.Ticker(symbol)
-            # auto_adjust=True accounts for splits/dividends in the Close price
-            df = ticker.history(period=period, interval=interval, auto_adjust=True)
+            # 1. Fetch from Yahoo Finance on a worker thread so the event loop stays responsive
+            df = await asyncio.to_thread(MarketDataService._download_history, symbol, period, interval)
+        except Exception as e:
+            logger.error(f"Failed to fetch market data for {symbol}: {e}")
+            return 0
+
+        return await MarketDataService._store_history(db, symbol, df)
+
+    @staticmethod
+    async def fetch_and_store_many(
+        db: AsyncSession, symbols: List[str], period: str = "2y", interval: str = "1d"
+    ) -> Dict[str, int]:
+        """Refreshes several symbols, downloading them concurrently.
+
+        Downloads run in parallel threads; the upserts are then applied one by one
+        because a single session cannot execute statements concurrently.
 
+        Returns:
+            Mapping of symbol to number of candles inserted/updated.
+        """
+        frames = await asyncio.gather(
+            *(asyncio.to_thread(MarketDataService._download_history, s, period, interval) for s in symbols),
+            return_exceptions=True,
+        )
+
+        stored = {}
+        for symbol, df in zip(symbols, frames):
+            if isinstance(df, Exception):
+                logger.error(f"Failed to fetch market data for {symbol}: {df}")
+                stored[symbol] = 0
+                continue
+            stored[symbol] = await MarketDataService._store_history(db, symbol, df)
+        return stored
+
+    @staticmethod
+    def _download_history(symbol: str, period: str, interval: str) -> pd.DataFrame:
+        """Blocking Yahoo Finance download (HTTP + parsing)."""
+        # auto_adjust=True accounts for splits/dividends in the Close price
+        return yf.Ticker(symbol).history(period=period, interval=interval, auto_adjust=True)
+
+    @staticmethod
+    async def _store_history(db: AsyncSession, symbol: str, df: pd.DataFrame) -> int:
+        """Upserts a downloaded history frame into `historical_candles`."""
+        try:
             if df.empty:
                 logger.warning(f"No historical data found for {symbol}")
                 return 0
 
             # 2. Convert DataFrame to Dictionaries
-            candles_data = []
-            for index, row in df.iterrows():
-                # Index is Timestamp
-                ts = index.to_pydatetime()
-                if ts.tzinfo is None:
-                    ts = ts.replace(tzinfo=timezone.utc)
-
-                candles_data.append(
-                    {
-                        "symbol": symbol,
-                        "timestamp": ts,
-                        "open": float(row["Open"]),
-                        "high": float(row["High"]),
-                        "low": float(row["Low"]),
-                        "close": float(row["Close"]),
-                        "volume": int(row["Volume"]),
-                    }
+            # Pull each column out as a NumPy array once instead of boxing every row into a Series
+            # Naive indexes are tagged as UTC in one vectorized call
+            index = df.index if df.index.tz is not None else df.index.tz_localize("UTC")
+            timestamps = index.to_pydatetime()
+            candles_data = [
+                {
+                    "symbol": symbol,
+                    "timestamp": ts,
+                    "open": float(o),
+                    "high": float(h),
+                    "low": float(lo),
+                    "close": float(c),
+                    "volume": int(v),
+                }
+                for ts, o, h, lo, c, v in zip(
+                    timestamps,
+                    df["Open"].to_numpy(),
+                    df["High"].to_numpy(),
+                    df["Low"].to_numpy(),
+                    df["Close"].to_numpy(),
+                    df["Volume"].to_numpy(),
                 )
+            ]
 
             if not candles_data:
                 return 0
 
             # 3. Bulk Upsert
-            # Use PostgreSQL ON CONFLICT to update existing records
-            stmt = insert(HistoricalCandle).values(candles_data)
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["symbol", "timestamp"],
-                set_={
-                    "open": stmt.excluded.open,
-                    "high": stmt.excluded.high,
-                    "low": stmt.excluded.low,
-                    "close": stmt.excluded.close,
-                    "volume": stmt.excluded.volume,
-                    "updated_at": func.now(),
-                },
-            )
-
-            await db.execute(stmt)
+            if len(candles_data) > COPY_THRESHOLD:
+                # Large histories: stream rows with COPY instead of parsing one giant VALUES list
+                await MarketDataService._copy_upsert(db, candles_data)
+            else:
+                # Use PostgreSQL ON CONFLICT to update existing records
+                # Core table insert: no ORM entity bookkeeping for what is a pure bulk write
+                stmt = insert(HistoricalCandle.__table__).values(candles_data)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["symbol", "timestamp"],
+                    set_={
+                        "open": stmt.excluded.open,
+                        "high": stmt.excluded.high,
+                        "low": stmt.excluded.low,
+                        "close": stmt.excluded.close,
+                        "volume": stmt.excluded.volume,
+                        "updated_at": func.now(),
+                    },
+                )
+                await db.execute(stmt)
+
             await db.commit()
 
             logger.info(f"Stored {len(candles_data)} candles for {symbol}")
             return len(candles_data)
 
         except Exception as e:
-            logger.error(f"Failed to fetch market data for {symbol}: {e}")
+            logger.error(f"Failed to store market data for {symbol}: {e}")
             await db.rollback()
             return 0
 
+    @staticmethod
+    async def _copy_upsert(db: AsyncSession, candles_data: List[dict]) -> None:
+        """Upserts candles via COPY into a transaction-scoped staging table.
+
+        Runs on the session's own connection, so it shares the caller's transaction.
+        """
+        conn = await db.connection()
+        raw = await conn.get_raw_connection()
+        asyncpg_conn = raw.driver_connection
+
+        await db.execute(text(f"CREATE TEMP TABLE {_STAGING_TABLE} (LIKE historical_candles) ON COMMIT DROP"))
+        await asyncpg_conn.copy_records_to_table(
+            _STAGING_TABLE,
+            records=[tuple(row[col] for col in _CANDLE_COLUMNS) for row in candles_data],
+            columns=list(_CANDLE_COLUMNS),
+        )
+        await db.execute(_UPSERT_FROM_STAGING)
+        await db.execute(text(f"DROP TABLE {_STAGING_TABLE}"))
+
     @staticmethod
     async def get_candles(db: AsyncSession, symbol: str, days: int = 365) -> List[HistoricalCandle]:
         """Retrieves historical candles from DB for analysis."""
@@ -103,3 +190,16 @@ class MarketDataService:
             .order_by(HistoricalCandle.timestamp.asc())
         )
         return result.scalars().all()
+
+    @staticmethod
+    async def get_closes(db: AsyncSession, symbol: str, days: int = 365) -> List[Tuple[datetime, float]]:
+        """Retrieves (timestamp, close) pairs from DB without building ORM objects."""
+        cutoff = datetime.now(timezone.utc) - pd.Timedelta(days=days)
+        candles = HistoricalCandle.__table__.c
+
+        result = await db.execute(
+            select(candles.timestamp, candles.close)
+            .where(candles.symbol == symbol, candles.timestamp >= cutoff)
+            .order_by(candles.timestamp.asc())
+        )
+        return [(ts, float(close)) for ts, close in result]
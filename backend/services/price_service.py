@@ -7,12 +7,35 @@ persistent storage.
 
 import logging
 import datetime
-from sqlalchemy import select
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from sqlalchemy import insert, literal_column, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
+from redis.exceptions import RedisError
+from core.redis import get_redis_client
 from models.assets import MarketPriceHistory
 
 logger = logging.getLogger(__name__)
 
+# Minimum spacing between two recorded prices of the same asset/provider.
+RECORD_THROTTLE = datetime.timedelta(minutes=5)
+
+# Reference price used for the 24h change, cached per asset/provider.
+# It drifts by at most one TTL as the 24h window slides.
+_ANCHOR_PRICE_PREFIX = "p24h:"
+ANCHOR_PRICE_TTL_SEC = 300
+
+
+@dataclass
+class PriceTick:
+    """A single price observation collected during a sync cycle."""
+
+    symbol: str
+    provider_id: str
+    price: float
+    currency: str
+
 
 class PriceTrackingService:
     """Utility service for recording and analyzing market prices.
@@ -21,89 +44,163 @@ class PriceTrackingService:
     """
 
     @staticmethod
-    async def record_price(db: AsyncSession, symbol: str, provider_id: str, price: float, currency: str):
-        """Records the current price of an asset in the history table.
+    async def record_prices_bulk(
+        db: AsyncSession, ticks: List[PriceTick], *, now: Optional[datetime.datetime] = None
+    ) -> int:
+        """Records a whole sync cycle worth of prices in a single INSERT.
+
+        To prevent database bloat, an asset/provider that already has an entry
+        within the last 5 minutes is skipped; all of them are resolved with one
+        grouped lookup. The transaction is left to the caller.
 
-        To prevent database bloat, this method implements a 5-minute throttling:
-        it will not record a new entry if an entry for the same asset/provider
-        exists within the last 5 minutes.
+        Returns:
+            Number of rows written.
         """
-        if price <= 0:
-            return
+        ticks = [t for t in ticks if t.price > 0]
+        if not ticks:
+            return 0
 
-        # Check last entry to prevent spam
-        recent_cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(minutes=5)
+        recent_cutoff = (now or datetime.datetime.now(datetime.timezone.utc)) - RECORD_THROTTLE
+        symbols = {t.symbol for t in ticks}
+        providers = {t.provider_id for t in ticks}
 
         result = await db.execute(
-            select(MarketPriceHistory)
+            select(MarketPriceHistory.symbol, MarketPriceHistory.provider_id)
             .where(
-                MarketPriceHistory.symbol == symbol,
-                MarketPriceHistory.provider_id == provider_id,
+                MarketPriceHistory.symbol.in_(symbols),
+                MarketPriceHistory.provider_id.in_(providers),
                 MarketPriceHistory.timestamp >= recent_cutoff,
             )
-            .order_by(MarketPriceHistory.timestamp.desc())
-            .limit(1)
+            .group_by(MarketPriceHistory.symbol, MarketPriceHistory.provider_id)
         )
-        existing = result.scalar_one_or_none()
+        throttled = {(row.symbol, row.provider_id) for row in result}
+
+        rows = []
+        seen = set()
+        for t in ticks:
+            key = (t.symbol, t.provider_id)
+            if key in throttled or key in seen:
+                continue
+            seen.add(key)
+            rows.append(
+                {
+                    "id": uuid.uuid4(),
+                    "symbol": t.symbol,
+                    "provider_id": t.provider_id,
+                    "price": t.price,
+                    "currency": t.currency,
+                }
+            )
 
-        if existing:
-            # Update the existing recent entry to keep it "fresh" or just skip?
-            # If we update, we lose the granularity of "5 mins ago".
-            # Better to just skip recording if we have a recent one.
-            return
+        if rows:
+            await db.execute(insert(MarketPriceHistory).values(rows))
+        return len(rows)
 
-        new_entry = MarketPriceHistory(symbol=symbol, provider_id=provider_id, price=price, currency=currency)
-        db.add(new_entry)
-        # Commit should be handled by caller or here?
-        # Usually caller (task) manages transaction, but let's be safe.
-        # If we use the same session as the task, we shouldn't commit mid-transaction if user doesn't want to.
-        # But here we are just adding to session.
+    @staticmethod
+    async def calculate_24h_change(
+        db: AsyncSession,
+        symbol: str,
+        provider_id: str,
+        current_price: float,
+        *,
+        now: Optional[datetime.datetime] = None,
+    ) -> float:
+        """Calculates the percentage price change of one asset over the last 24 hours.
+
+        Single-symbol form of `calculate_24h_changes_bulk`.
+        """
+        changes = await PriceTrackingService.calculate_24h_changes_bulk(
+            db, provider_id, {symbol: current_price}, now=now
+        )
+        return changes[symbol]
 
     @staticmethod
-    async def calculate_24h_change(db: AsyncSession, symbol: str, provider_id: str, current_price: float) -> float:
-        """Calculates the percentage price change over the last 24 hours.
+    async def calculate_24h_changes_bulk(
+        db: AsyncSession,
+        provider_id: str,
+        current_prices: Dict[str, float],
+        *,
+        now: Optional[datetime.datetime] = None,
+    ) -> Dict[str, float]:
+        """Calculates the 24h change for many symbols of one provider at once.
 
         Algorithm:
         1. Look for the closest historical price point that is exactly 24h old.
         2. If 24h of history is missing, fallback to the oldest available data point.
         3. Returns 0.0 if no history is found or historical price is zero.
+
+        Reference prices are cached in Redis for a few minutes and read with one
+        MGET; the misses are resolved with a single history query.
+
+        Returns:
+            Mapping of symbol -> percentage change (0.0 when there is no usable history).
         """
-        if current_price <= 0:
-            return 0.0
+        symbols = [symbol for symbol, price in current_prices.items() if price > 0]
+        changes = {symbol: 0.0 for symbol in current_prices}
+        if not symbols:
+            return changes
+
+        provider_key = getattr(provider_id, "value", provider_id)
+        cache_keys = {symbol: f"{_ANCHOR_PRICE_PREFIX}{provider_key}:{symbol}" for symbol in symbols}
+        redis = get_redis_client()
+        try:
+            cached = await redis.mget(list(cache_keys.values()))
+        except RedisError as e:
+            logger.debug(f"Anchor price cache unavailable: {e}")
+            cached = [None] * len(symbols)
+
+        anchors = {symbol: float(value) for symbol, value in zip(symbols, cached) if value is not None}
+        missing = [symbol for symbol in symbols if symbol not in anchors]
+        if missing:
+            loaded = await PriceTrackingService._load_anchor_prices(db, missing, provider_id, now)
+            anchors.update(loaded)
+            if loaded:
+                try:
+                    async with redis.pipeline(transaction=False) as pipe:
+                        for symbol, price in loaded.items():
+                            pipe.set(cache_keys[symbol], str(price), ex=ANCHOR_PRICE_TTL_SEC)
+                        await pipe.execute()
+                except RedisError as e:
+                    logger.debug(f"Anchor price cache unavailable: {e}")
+
+        for symbol, old_price in anchors.items():
+            changes[symbol] = _percent_change(current_prices[symbol], old_price)
+        return changes
 
-        target_time = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=24)
+    @staticmethod
+    async def _load_anchor_prices(
+        db: AsyncSession, symbols: List[str], provider_id: str, now: Optional[datetime.datetime]
+    ) -> Dict[str, float]:
+        """Fetches the 24h reference prices of a provider's symbols in one query.
 
-        # Phase 1: Seek the anchor point (newest point that is <= 24h ago)
-        result = await db.execute(
-            select(MarketPriceHistory)
-            .where(
-                MarketPriceHistory.symbol == symbol,
-                MarketPriceHistory.provider_id == provider_id,
-                MarketPriceHistory.timestamp <= target_time,
-            )
-            .order_by(MarketPriceHistory.timestamp.desc())
-            .limit(1)
+        Symbols without any history are absent from the result.
+        """
+        target_time = (now or datetime.datetime.now(datetime.timezone.utc)) - datetime.timedelta(hours=24)
+
+        asset_prices = select(MarketPriceHistory.symbol, MarketPriceHistory.price).where(
+            MarketPriceHistory.symbol.in_(symbols),
+            MarketPriceHistory.provider_id == provider_id,
         )
-        historical_point = result.scalar_one_or_none()
-
-        if not historical_point:
-            # Fallback: We don't have 24h history, use the absolute oldest entry.
-            result = await db.execute(
-                select(MarketPriceHistory)
-                .where(
-                    MarketPriceHistory.symbol == symbol,
-                    MarketPriceHistory.provider_id == provider_id,
-                )
-                .order_by(MarketPriceHistory.timestamp.asc())
-                .limit(1)
-            )
-            historical_point = result.scalar_one_or_none()
+        # DISTINCT ON keeps one row per symbol: the newest point <= 24h ago, and the oldest overall
+        anchor = (
+            asset_prices.add_columns(literal_column("0").label("pref"))
+            .where(MarketPriceHistory.timestamp <= target_time)
+            .distinct(MarketPriceHistory.symbol)
+            .order_by(MarketPriceHistory.symbol, MarketPriceHistory.timestamp.desc())
+        )
+        oldest = (
+            asset_prices.add_columns(literal_column("1").label("pref"))
+            .distinct(MarketPriceHistory.symbol)
+            .order_by(MarketPriceHistory.symbol, MarketPriceHistory.timestamp.asc())
+        )
+        result = await db.execute(union_all(anchor, oldest).order_by(literal_column("pref").desc()))
 
-        if not historical_point:
-            return 0.0
+        # Rows arrive fallback-first, so the anchor row overwrites the fallback when both exist
+        return {row.symbol: float(row.price) for row in result}
 
-        old_price = float(historical_point.price)
-        if old_price == 0:
-            return 0.0
 
-        return ((current_price - old_price) / old_price) * 100
+def _percent_change(current_price: float, old_price: float) -> float:
+    """Percentage change from `old_price` to `current_price` (0.0 for a zero reference price)."""
+    if old_price == 0:
+        return 0.0
+    return ((current_price - old_price) / old_price) * 100
@@ -4,26 +4,166 @@ Responsible for:
 1. Completeness check (ensures all integrations are synced)
 2. Deduplication (45-second window to prevent snapshot spam)
 3. Atomic snapshot creation/update
-4. Use of DistributedLock to prevent race conditions
+4. Per-user Postgres advisory lock to prevent race conditions
 
 Extracted from tasks.py following the Single Responsibility Principle (SRP).
 """
 
 import datetime
 import logging
-from typing import Optional, Dict, Any
+import uuid
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Tuple
 
-from sqlalchemy import select, func
+from sqlalchemy import Integer, Interval, literal, Select, bindparam, insert, select, func, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import RedisError
 
-from models.assets import UnifiedAsset, PortfolioSnapshot
+from models.assets import UnifiedAsset, PortfolioSnapshot, UserPortfolioTotal
 from models.integration import Integration
-from services.distributed_lock import LockManager
+from services.distributed_lock import (
+    PORTFOLIO_TOTAL_LOCK_NAMESPACE,
+    SNAPSHOT_LOCK_NAMESPACE,
+    acquire_advisory_xact_lock,
+)
 from core.config import settings
 
 logger = logging.getLogger(__name__)
 
-# --- Constants removed and moved to config.py ---
+# --- Completeness cache (Redis) ---
+# Set of integration ids that currently have rows in unified_assets, plus the
+# user's active integration count. Both are seeded together from SQL on a miss.
+_SYNCED_SET_PREFIX = "synced_integrations:"
+_ACTIVE_COUNT_PREFIX = "active_integrations_count:"
+COMPLETENESS_CACHE_TTL_SEC = 3600
+
+# SADD only into an already seeded set: a set created by a single sync would undercount.
+_SADD_IF_EXISTS_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    return redis.call("SADD", KEYS[1], ARGV[1])
+end
+return 0
+"""
+
+# Id of the user's latest snapshot, kept for SNAPSHOT_DEDUP_WINDOW_SEC after each write.
+# While present, the next attempt updates that row instead of inserting a new one.
+_SNAPSHOT_DEDUP_PREFIX = "snapshot_dedup:"
+
+# Number of snapshots written per user. A caller that sees it advance by 2+ while
+# waiting for the lock knows a full snapshot ran after its own data was committed.
+_SNAPSHOT_COUNTER_PREFIX = "snap_counter:"
+_SNAPSHOT_COUNTER_TTL_SEC = 86400
+
+
+# --- Prebuilt statements ---
+# Built once at import; call sites only bind :user_id, so no per-call statement construction.
+# Snapshot times and the dedup cutoff come from Postgres' clock at statement start. Not now():
+# the snapshot transaction begins with the lock wait, which would date them up to
+# SNAPSHOT_LOCK_TIMEOUT_SEC early.
+_SNAPSHOT_NOW = func.statement_timestamp()
+_DEDUP_CUTOFF = _SNAPSHOT_NOW - literal(datetime.timedelta(seconds=settings.SNAPSHOT_DEDUP_WINDOW_SEC), Interval)
+_STMT_COUNT_INTEGRATIONS = select(func.count(Integration.id)).where(
+    Integration.user_id == bindparam("user_id"),
+    Integration.is_active == True,  # noqa: E712
+)
+_STMT_COUNT_SYNCED = select(func.count(func.distinct(UnifiedAsset.integration_id))).where(
+    UnifiedAsset.user_id == bindparam("user_id")
+)
+_STMT_SYNCED_IDS = select(UnifiedAsset.integration_id).where(UnifiedAsset.user_id == bindparam("user_id")).distinct()
+_STMT_SUM_USD = select(UserPortfolioTotal.total_usd).where(UserPortfolioTotal.user_id == bindparam("user_id"))
+# Aggregate without GROUP BY: always one row, so a user left with no assets gets a NULL total
+_REFRESH_TOTAL_INSERT = pg_insert(UserPortfolioTotal).from_select(
+    ["user_id", "total_usd"],
+    select(bindparam("user_id", type_=Integer), func.sum(UnifiedAsset.usd_value)).where(
+        UnifiedAsset.user_id == bindparam("user_id")
+    ),
+)
+_STMT_REFRESH_TOTAL = _REFRESH_TOTAL_INSERT.on_conflict_do_update(
+    index_elements=[UserPortfolioTotal.user_id],
+    set_={"total_usd": _REFRESH_TOTAL_INSERT.excluded.total_usd, "updated_at": func.now()},
+)
+# Serialises total refreshes per user until commit: the SUM above only sees rows committed
+# before it starts, so two transactions rewriting different integrations must not overlap
+_STMT_LOCK_TOTAL = select(
+    func.pg_advisory_xact_lock(PORTFOLIO_TOTAL_LOCK_NAMESPACE, bindparam("user_id", type_=Integer))
+)
+_STMT_SNAPSHOT_EXISTS = select(PortfolioSnapshot.id).where(PortfolioSnapshot.id == bindparam("snapshot_id"))
+_STMT_RECENT_SNAPSHOT = (
+    select(PortfolioSnapshot.id, PortfolioSnapshot.timestamp, PortfolioSnapshot.total_value_usd)
+    .where(
+        PortfolioSnapshot.user_id == bindparam("user_id"),
+        PortfolioSnapshot.timestamp >= _DEDUP_CUTOFF,
+    )
+    .order_by(PortfolioSnapshot.timestamp.desc())
+    .limit(1)
+)
+
+
+def _build_snapshot_context_stmt(with_completeness: bool, with_recent: bool) -> Select:
+    """Builds the combined statement behind `SnapshotService._load_snapshot_context`."""
+    columns = [_STMT_SUM_USD.scalar_subquery().label("net_worth")]
+    if with_completeness:
+        columns += [
+            _STMT_COUNT_INTEGRATIONS.scalar_subquery().label("total_count"),
+            _STMT_COUNT_SYNCED.scalar_subquery().label("synced_count"),
+        ]
+    if with_recent:
+        columns.append(
+            _STMT_RECENT_SNAPSHOT.with_only_columns(PortfolioSnapshot.id).scalar_subquery().label("recent_id")
+        )
+    return select(*columns)
+
+
+_STMT_SNAPSHOT_CONTEXT = {
+    (with_completeness, with_recent): _build_snapshot_context_stmt(with_completeness, with_recent)
+    for with_completeness in (True, False)
+    for with_recent in (True, False)
+}
+
+
+def _build_batch_context_stmt() -> Select:
+    """Per-user net worth, completeness and dedup candidate for a list of users, in one grouped SELECT."""
+    user_id = UnifiedAsset.user_id
+    total_count = (
+        select(func.count(Integration.id))
+        .where(Integration.user_id == user_id, Integration.is_active == True)  # noqa: E712
+        .scalar_subquery()
+    )
+    recent_id = (
+        select(PortfolioSnapshot.id)
+        .where(PortfolioSnapshot.user_id == user_id, PortfolioSnapshot.timestamp >= _DEDUP_CUTOFF)
+        .order_by(PortfolioSnapshot.timestamp.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    return (
+        select(
+            user_id,
+            func.sum(UnifiedAsset.usd_value).label("net_worth"),
+            func.count(UnifiedAsset.id).label("asset_count"),
+            func.count(func.distinct(UnifiedAsset.integration_id)).label("synced_count"),
+            total_count.label("total_count"),
+            recent_id.label("recent_id"),
+        )
+        .where(user_id.in_(bindparam("user_ids", expanding=True)))
+        .group_by(user_id)
+    )
+
+
+_STMT_BATCH_CONTEXT = _build_batch_context_stmt()
+
+
+@dataclass
+class _CachedSnapshotState:
+    """Snapshot inputs answered by Redis (one pipeline)."""
+
+    available: bool = False
+    completeness: Optional[Dict[str, Any]] = None
+    recent_id: Optional[str] = None
+    counter: int = 0
 
 
 class SnapshotService:
@@ -35,14 +175,15 @@ class SnapshotService:
     - Partial snapshots are NOT recorded (prevents gaps in the chart)
     """
 
-    def __init__(self, lock_manager: LockManager):
-        self._lock_manager = lock_manager
+    def __init__(self, redis_client: Optional[Redis] = None):
+        self._redis = redis_client
 
     async def create_or_update_snapshot(
         self,
         db: AsyncSession,
         user_id: int,
         new_assets_count: int,
+        hint_total_usd: Optional[float] = None,
     ) -> Optional[PortfolioSnapshot]:
         """Creates or updates a portfolio snapshot for the user.
 
@@ -53,47 +194,85 @@ class SnapshotService:
             db: Async database session (must be NEW, not from the same transaction)
             user_id: User ID
             new_assets_count: Asset count in the latest sync
+            hint_total_usd: USD value of the latest sync. Used as the net worth when the
+                cache shows that sync's integration is the only one holding assets.
 
         Returns:
             PortfolioSnapshot if created/updated, None if skipped.
         """
-        lock = self._lock_manager.snapshot_lock(user_id)
+        counter_at_entry = await self._read_snapshot_counter(user_id)
 
-        if not await lock.acquire(timeout_sec=settings.SNAPSHOT_LOCK_TIMEOUT_SEC):
+        # Held by this session's transaction; the commit (or rollback below) releases it
+        if not await acquire_advisory_xact_lock(
+            db, SNAPSHOT_LOCK_NAMESPACE, user_id, settings.SNAPSHOT_LOCK_TIMEOUT_SEC
+        ):
             logger.warning(f"Snapshot lock timeout for user {user_id}. Skipping.")
             return None
 
         try:
-            return await self._create_snapshot_under_lock(db, user_id, new_assets_count)
+            return await self._create_snapshot_under_lock(
+                db, user_id, new_assets_count, counter_at_entry, hint_total_usd
+            )
         finally:
-            await lock.release()
+            if db.in_transaction():
+                await db.rollback()
 
     async def _create_snapshot_under_lock(
         self,
         db: AsyncSession,
         user_id: int,
         new_assets_count: int,
+        counter_at_entry: Optional[int] = None,
+        hint_total_usd: Optional[float] = None,
     ) -> Optional[PortfolioSnapshot]:
         """Internal snapshot creation logic running under a lock."""
-        # 1. Check completeness — (Information only, no longer blocking)
-        completeness = await self._check_completeness(db, user_id)
+        cached = await self._read_cached_state(user_id)
+
+        # 0. Borrow: a snapshot that started after our data was committed already covers it.
+        # Its Redis keys are published before its commit (and reverted only after a failed
+        # commit has released the lock), so confirm the row actually exists.
+        if (
+            counter_at_entry is not None
+            and cached.available
+            and cached.counter >= counter_at_entry + 2
+            and cached.recent_id is not None
+            and await db.scalar(_STMT_SNAPSHOT_EXISTS, {"snapshot_id": uuid.UUID(cached.recent_id)}) is not None
+        ):
+            logger.debug(f"Snapshot for user {user_id} borrowed from a concurrent sync; skipping.")
+            return None
+
+        # 1-3. Completeness and dedup candidate from Redis when warm; net worth (plus whatever
+        # Redis could not answer) from Postgres in a single round trip
+        cache_ok = cached.available
+        if (
+            hint_total_usd is not None
+            and new_assets_count > 0
+            and cached.completeness is not None
+            and cached.completeness["total_count"] == cached.completeness["synced_count"] == 1
+        ):
+            # Fast path: the only integration with assets is the one just synced, so its
+            # total is the net worth and Redis answered the rest; no SQL round trip at all
+            completeness, net_worth, recent_id = cached.completeness, hint_total_usd, None
+        else:
+            completeness, net_worth, recent_id = await self._load_snapshot_context(
+                db, user_id, with_completeness=cached.completeness is None, with_recent=not cache_ok
+            )
+            if cached.completeness is not None:
+                completeness = cached.completeness
+            else:
+                await self._seed_completeness_cache(db, user_id, completeness["total_count"])
 
+        # Completeness is information only, no longer blocking
         if completeness["is_partial"]:
             logger.debug(
                 f"Partial data snapshot for user {user_id} "
                 f"({completeness['synced_count']}/{completeness['total_count']} integrations)."
             )
 
-        # 2. Calculate current net worth
-        net_worth = await self._calculate_net_worth(db, user_id)
-
         if net_worth is None or net_worth < 0:
             logger.warning(f"Invalid net worth for user {user_id}: {net_worth}")
             return None
 
-        # 3. Deduplication — look for a recent snapshot within the window
-        existing = await self._find_recent_snapshot(db, user_id)
-
         # 4. Form metadata
         snapshot_data: Dict[str, Any] = {
             "asset_count": new_assets_count,
@@ -104,79 +283,259 @@ class SnapshotService:
         }
 
         # 5. Create or update
-        if existing:
-            snapshot = await self._update_existing_snapshot(existing, net_worth, snapshot_data)
-        else:
-            snapshot = self._create_new_snapshot(db, user_id, net_worth, snapshot_data)
+        if cache_ok and cached.recent_id:
+            recent_id = uuid.UUID(cached.recent_id)
+
+        existing = None
+        if recent_id is not None:
+            existing = await self._update_snapshot_by_id(db, recent_id, net_worth, snapshot_data)
+        snapshot = existing or self._create_new_snapshot(db, user_id, net_worth, snapshot_data)
+
+        # Redis first: the commit releases the lock, and the next holder must see this write
+        remembered = await self._remember_recent_snapshot(user_id, snapshot.id)
 
         # CRITICAL: Commit the snapshot to the database
-        await db.commit()
+        try:
+            await db.commit()
+        except Exception:
+            # The row was never written: waiters must not borrow it, nor the dedup key point at it
+            if remembered:
+                await self._forget_recent_snapshot(user_id)
+            raise
 
         logger.info(f"Snapshot {'updated' if existing else 'created'} for user {user_id}: ${float(net_worth):,.2f}")
         return snapshot
 
+    async def create_or_update_snapshots_batch(self, db: AsyncSession, user_ids: List[int]) -> Dict[int, uuid.UUID]:
+        """Creates or updates snapshots for many users with one SELECT and one write per kind.
+
+        Used after a scheduled global sync, once all integration data is committed.
+        Same rules as `create_or_update_snapshot` (dedup window, invalid net worth
+        skipped), but without the per-user snapshot lock: a concurrent manual sync
+        can at worst add one extra snapshot inside the window.
+
+        Returns:
+            Mapping of user id to the snapshot id written for that user.
+        """
+        if not user_ids:
+            return {}
+
+        result = await db.execute(_STMT_BATCH_CONTEXT, {"user_ids": list(set(user_ids))})
+
+        updates: List[Dict[str, Any]] = []
+        inserts: List[Dict[str, Any]] = []
+        written: Dict[int, uuid.UUID] = {}
+        for row in result:
+            if row.net_worth is None or row.net_worth < 0:
+                logger.warning(f"Invalid net worth for user {row.user_id}: {row.net_worth}")
+                continue
+
+            total = row.total_count or 0
+            data = {
+                "asset_count": row.asset_count,
+                "source": "global_sync",
+                "integrations_count": row.synced_count,
+                "total_integrations": total,
+                "is_partial": False,
+            }
+            if row.recent_id is not None:
+                updates.append({"id": row.recent_id, "total_value_usd": row.net_worth, "data": data})
+                written[row.user_id] = row.recent_id
+            else:
+                snapshot_id = uuid.uuid4()
+                inserts.append(
+                    {"id": snapshot_id, "user_id": row.user_id, "total_value_usd": row.net_worth, "data": data}
+                )
+                written[row.user_id] = snapshot_id
+
+        # ORM bulk UPDATE by primary key and multi-row INSERT (executemany)
+        if updates:
+            await db.execute(update(PortfolioSnapshot), updates)
+        if inserts:
+            await db.execute(insert(PortfolioSnapshot), inserts)
+        await db.commit()
+
+        await self._remember_recent_snapshots(written)
+
+        logger.info(f"Batch snapshots: {len(updates)} updated, {len(inserts)} created for {len(user_ids)} users")
+        return written
+
     # --- Private Helpers ---
 
-    async def _check_completeness(self, db: AsyncSession, user_id: int) -> Dict[str, Any]:
-        """Checks if all of the user's active integrations have data in unified_assets.
+    async def _load_snapshot_context(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        with_completeness: bool = True,
+        with_recent: bool = True,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[float], Optional[uuid.UUID]]:
+        """Loads everything the snapshot decision needs with one statement.
+
+        Net worth (from user_portfolio_totals), the active and synced integration
+        counts and the latest snapshot inside the dedup window are each a scalar
+        subquery of a single FROM-less SELECT.
+        Only plain columns are selected, so no ORM instances are built.
+
+        With `with_completeness=False` the two counts are left out and the
+        completeness dict is returned as None; with `with_recent=False` the
+        snapshot lookup is skipped and no id is returned.
 
         Returns:
-            Dict with keys: total_count, synced_count, is_partial
+            (completeness dict, net worth or None, recent snapshot id or None)
         """
-        # Number of active integrations
-        total_result = await db.execute(
-            select(func.count(Integration.id)).where(
-                Integration.user_id == user_id,
-                Integration.is_active == True,  # noqa: E712
-            )
-        )
-        total_count = total_result.scalar() or 0
+        result = await db.execute(_STMT_SNAPSHOT_CONTEXT[(with_completeness, with_recent)], {"user_id": user_id})
+        row = result.one()
+
+        completeness = None
+        if with_completeness:
+            total = row.total_count or 0
+            synced = row.synced_count or 0
+            completeness = {
+                "total_count": total,
+                "synced_count": synced,
+                "is_partial": synced < total,
+            }
+        net_worth = float(row.net_worth) if row.net_worth is not None else None
+        return completeness, net_worth, row.recent_id if with_recent else None
+
+    async def _read_snapshot_counter(self, user_id: int) -> Optional[int]:
+        """Snapshot counter before queueing for the lock (None without Redis)."""
+        if self._redis is None:
+            return None
+        try:
+            return int(await self._redis.get(f"{_SNAPSHOT_COUNTER_PREFIX}{user_id}") or 0)
+        except RedisError as e:
+            logger.debug(f"Snapshot cache unavailable: {e}")
+            return None
 
-        # Number of integrations that have data in unified_assets
-        synced_result = await db.execute(
-            select(func.count(func.distinct(UnifiedAsset.integration_id))).where(UnifiedAsset.user_id == user_id)
-        )
-        synced_count = synced_result.scalar() or 0
+    async def _read_cached_state(self, user_id: int) -> _CachedSnapshotState:
+        """Reads completeness, dedup and counter keys in one pipeline."""
+        if self._redis is None:
+            return _CachedSnapshotState()
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.exists(f"{_SYNCED_SET_PREFIX}{user_id}")
+                pipe.scard(f"{_SYNCED_SET_PREFIX}{user_id}")
+                pipe.get(f"{_ACTIVE_COUNT_PREFIX}{user_id}")
+                pipe.get(f"{_SNAPSHOT_DEDUP_PREFIX}{user_id}")
+                pipe.get(f"{_SNAPSHOT_COUNTER_PREFIX}{user_id}")
+                seeded, synced, total, recent_id, counter = await pipe.execute()
+        except RedisError as e:
+            logger.debug(f"Snapshot cache unavailable: {e}")
+            return _CachedSnapshotState()
+
+        completeness = None
+        if seeded and total is not None:
+            total = int(total)
+            completeness = {"total_count": total, "synced_count": synced, "is_partial": synced < total}
+        return _CachedSnapshotState(True, completeness, recent_id, int(counter or 0))
+
+    async def _remember_recent_snapshot(self, user_id: int, snapshot_id) -> bool:
+        """(Re)starts the dedup window and bumps the snapshot counter after a write."""
+        return await self._remember_recent_snapshots({user_id: snapshot_id})
+
+    async def _remember_recent_snapshots(self, snapshot_ids: Dict[int, Any]) -> bool:
+        """Same as `_remember_recent_snapshot` for many users, in one pipeline.
 
-        return {
-            "total_count": total_count,
-            "synced_count": synced_count,
-            "is_partial": synced_count < total_count,
-        }
+        Returns:
+            True if the keys were written.
+        """
+        if self._redis is None or not snapshot_ids:
+            return False
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for user_id, snapshot_id in snapshot_ids.items():
+                    counter_key = f"{_SNAPSHOT_COUNTER_PREFIX}{user_id}"
+                    pipe.set(
+                        f"{_SNAPSHOT_DEDUP_PREFIX}{user_id}", str(snapshot_id), ex=settings.SNAPSHOT_DEDUP_WINDOW_SEC
+                    )
+                    pipe.incr(counter_key)
+                    pipe.expire(counter_key, _SNAPSHOT_COUNTER_TTL_SEC)
+                await pipe.execute()
+        except RedisError as e:
+            logger.debug(f"Snapshot cache unavailable: {e}")
+            return False
+        return True
+
+    async def _forget_recent_snapshot(self, user_id: int) -> None:
+        """Reverts `_remember_recent_snapshot` after the snapshot failed to commit."""
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.delete(f"{_SNAPSHOT_DEDUP_PREFIX}{user_id}")
+                pipe.decr(f"{_SNAPSHOT_COUNTER_PREFIX}{user_id}")
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Could not revert snapshot cache for user {user_id}: {e}")
+
+    async def _seed_completeness_cache(self, db: AsyncSession, user_id: int, total_count: int) -> None:
+        """Rebuilds the Redis completeness keys from SQL after a cache miss."""
+        if self._redis is None:
+            return
+        result = await db.execute(_STMT_SYNCED_IDS, {"user_id": user_id})
+        synced_ids = [str(i) for i in result.scalars()]
+
+        set_key = f"{_SYNCED_SET_PREFIX}{user_id}"
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.delete(set_key)
+                if synced_ids:
+                    pipe.sadd(set_key, *synced_ids)
+                    pipe.expire(set_key, COMPLETENESS_CACHE_TTL_SEC)
+                pipe.set(f"{_ACTIVE_COUNT_PREFIX}{user_id}", total_count, ex=COMPLETENESS_CACHE_TTL_SEC)
+                await pipe.execute()
+        except RedisError as e:
+            logger.debug(f"Completeness cache unavailable: {e}")
+
+    @staticmethod
+    def queue_integration_synced(pipe: Pipeline, user_id: int, integration_id, has_assets: bool) -> None:
+        """Queues the synced-integrations set update for a committed sync on `pipe`.
+
+        The caller executes the pipeline (together with its own end-of-sync writes)
+        and handles RedisError.
+        """
+        set_key = f"{_SYNCED_SET_PREFIX}{user_id}"
+        if has_assets:
+            pipe.eval(_SADD_IF_EXISTS_SCRIPT, 1, set_key, str(integration_id))
+        else:
+            pipe.srem(set_key, str(integration_id))
 
-    async def _calculate_net_worth(self, db: AsyncSession, user_id: int) -> Optional[float]:
-        """Calculates the total USD value of all the user's assets."""
-        result = await db.execute(select(func.sum(UnifiedAsset.usd_value)).where(UnifiedAsset.user_id == user_id))
-        value = result.scalar()
-        return float(value) if value is not None else None
+    @staticmethod
+    async def refresh_portfolio_total(db: AsyncSession, user_id: int) -> None:
+        """Recomputes the user's row in user_portfolio_totals from unified_assets.
 
-    async def _find_recent_snapshot(self, db: AsyncSession, user_id: int) -> Optional[PortfolioSnapshot]:
-        """Searches for a snapshot within the deduplication window."""
-        cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
-            seconds=settings.SNAPSHOT_DEDUP_WINDOW_SEC
-        )
-        result = await db.execute(
-            select(PortfolioSnapshot)
-            .where(
-                PortfolioSnapshot.user_id == user_id,
-                PortfolioSnapshot.timestamp >= cutoff,
-            )
-            .order_by(PortfolioSnapshot.timestamp.desc())
-            .limit(1)
-        )
-        return result.scalar_one_or_none()
+        Call inside the transaction that rewrites the user's assets, so the total
+        commits together with them. Takes a per-user advisory lock held until that
+        commit, so a concurrent refresh waits and then sums these rows too.
+        """
+        await db.flush()
+        await db.execute(_STMT_LOCK_TOTAL, {"user_id": user_id})
+        await db.execute(_STMT_REFRESH_TOTAL, {"user_id": user_id})
+
+    @staticmethod
+    async def invalidate_completeness_cache(redis: Redis, user_id: int) -> None:
+        """Drops the cached completeness state (integration created or deleted, or a failed update)."""
+        try:
+            await redis.delete(f"{_SYNCED_SET_PREFIX}{user_id}", f"{_ACTIVE_COUNT_PREFIX}{user_id}")
+        except RedisError as e:
+            logger.debug(f"Completeness cache unavailable: {e}")
 
-    async def _update_existing_snapshot(
+    async def _update_snapshot_by_id(
         self,
-        snapshot: PortfolioSnapshot,
+        db: AsyncSession,
+        snapshot_id: uuid.UUID,
         net_worth: float,
         data: Dict[str, Any],
-    ) -> PortfolioSnapshot:
-        """Updates an existing snapshot."""
-        snapshot.total_value_usd = net_worth
-        snapshot.timestamp = datetime.datetime.now(datetime.timezone.utc)
-        snapshot.data = data
-        return snapshot
+    ) -> Optional[PortfolioSnapshot]:
+        """Updates a snapshot by primary key; None if the row no longer exists.
+
+        The timestamp is refreshed to the statement time.
+        """
+        return await db.scalar(
+            update(PortfolioSnapshot)
+            .where(PortfolioSnapshot.id == snapshot_id)
+            .values(total_value_usd=net_worth, data=data, timestamp=_SNAPSHOT_NOW)
+            .returning(PortfolioSnapshot)
+        )
 
     def _create_new_snapshot(
         self,
@@ -187,7 +546,9 @@ class SnapshotService:
     ) -> PortfolioSnapshot:
         """Creates a new snapshot."""
         snapshot = PortfolioSnapshot(
+            id=uuid.uuid4(),  # known before flush, so it can be cached ahead of the commit
             user_id=user_id,
+            timestamp=_SNAPSHOT_NOW,
             total_value_usd=net_worth,
             data=data,
         )
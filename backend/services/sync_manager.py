@@ -1,11 +1,56 @@
 """Portfolio synchronization manager and task orchestrator."""
 
 import datetime
-from typing import Optional, Dict, Any
+import time
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple
 import redis.asyncio as redis
-from celery.result import AsyncResult
+from celery import states
+from services.distributed_lock import release_if_owner
 from worker.celery_app import celery_app
 
+if TYPE_CHECKING:
+    from celery import Task
+
+# Per-process cache of task statuses: task_id -> (expires_at monotonic, status dict).
+# In-flight statuses are reused briefly to absorb polling; terminal ones don't change.
+_status_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+STATUS_CACHE_TTL_SEC = 0.5
+TERMINAL_STATUS_CACHE_TTL_SEC = 60.0
+_STATUS_CACHE_MAX_ENTRIES = 1024
+
+# Single-flight marker per integration: set while a sync is queued or running, so the
+# global sync doesn't queue a duplicate that would only wait on the sync lock.
+# Holds its owner's token (task id or global sync run) and is only released by that owner.
+# Expires in case a worker dies before clearing it, but only after the longest holder
+# (a sync_integration_batch, 600s time limit) has run, with margin for time spent queued.
+SYNC_PENDING_PREFIX = "sync_pending:"
+SYNC_PENDING_TTL_SEC = 900
+
+
+async def release_sync_pending(redis_client: redis.Redis, integration_id, owner: str) -> None:
+    """Clears an integration's pending marker if `owner` still holds it."""
+    await release_if_owner(redis_client, f"{SYNC_PENDING_PREFIX}{integration_id}", owner)
+
+
+@lru_cache(maxsize=None)
+def _get_sync_task() -> "Task":
+    """Returns the bound sync task, imported on first use (worker.tasks imports services)."""
+    from worker.tasks import sync_integration_data
+
+    return sync_integration_data
+
+
+@dataclass
+class SyncState:
+    """Everything the sync panel renders, read in one Redis round trip."""
+
+    remaining_cooldown: int
+    active_task_id: Optional[str]
+    last_sync_time: Optional[datetime.datetime]
+
 
 class SyncManager:
     """Manages portfolio synchronization tasks.
@@ -34,6 +79,20 @@ class SyncManager:
         ttl = await self.redis.ttl(self._get_cooldown_key(user_id))
         return max(0, ttl)
 
+    async def get_sync_state(self, user_id: int) -> SyncState:
+        """Returns cooldown, active task and last sync time from a single pipeline."""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.ttl(self._get_cooldown_key(user_id))
+            pipe.get(f"sync_active_task:{user_id}")
+            pipe.get(f"sync_last_time:{user_id}")
+            ttl, task_id, ts = await pipe.execute()
+
+        return SyncState(
+            remaining_cooldown=max(0, ttl),
+            active_task_id=task_id or None,
+            last_sync_time=datetime.datetime.fromtimestamp(float(ts), tz=datetime.timezone.utc) if ts else None,
+        )
+
     async def can_trigger_sync(self, user_id: int) -> bool:
         """Checks if a sync can be triggered for this user."""
         remaining = await self.get_remaining_cooldown(user_id)
@@ -44,27 +103,34 @@ class SyncManager:
 
         Returns the task_id.
         """
-        # 1. Trigger Task (Using name to avoid circular import)
-        task = celery_app.send_task("sync_integration_data", args=[str(integration_id)])
-
-        # 2. Set Cooldown (only if enabled)
-        if self.COOLDOWN_SECONDS > 0:
-            await self.redis.setex(
-                self._get_cooldown_key(user_id), self.COOLDOWN_SECONDS, "active"
-            )
-
-        # 3. Set Active Task (for persistence)
-        # Expires after 5 minutes just in case
-        await self.redis.setex(f"sync_active_task:{user_id}", 300, task.id)
-
-        return task.id
+        # 1. Claim the pending marker before dispatch, so even a task that exits at once
+        # finds it to clear. A marker held by a queued global sync batch stays with that batch.
+        task_id = str(uuid.uuid4())
+        await self.redis.set(f"{SYNC_PENDING_PREFIX}{integration_id}", task_id, nx=True, ex=SYNC_PENDING_TTL_SEC)
+
+        # 2. Trigger Task (bound task, imported lazily to avoid circular import)
+        try:
+            _get_sync_task().apply_async((str(integration_id),), task_id=task_id)
+        except Exception:
+            await release_sync_pending(self.redis, integration_id, task_id)
+            raise
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            # 3. Set Cooldown (only if enabled)
+            if self.COOLDOWN_SECONDS > 0:
+                pipe.setex(self._get_cooldown_key(user_id), self.COOLDOWN_SECONDS, "active")
+
+            # 4. Set Active Task (for persistence)
+            # Expires after 5 minutes just in case
+            pipe.setex(f"sync_active_task:{user_id}", 300, task_id)
+            await pipe.execute()
+
+        return task_id
 
     async def get_active_task(self, user_id: int) -> Optional[str]:
         """Returns the task_id of the currently running sync, if any."""
-        # Use get which returns bytes (or str if decode_responses=True),
-        # but redis.asyncio with decode_responses=True returns str.
-        task_id = await self.redis.get(f"sync_active_task:{user_id}")
-        return str(task_id) if task_id else None
+        # The shared client uses decode_responses=True, so the value is already a str.
+        return await self.redis.get(f"sync_active_task:{user_id}") or None
 
     async def clear_active_task(self, user_id: int):
         """Clears the active task flag."""
@@ -72,8 +138,7 @@ class SyncManager:
 
     async def set_last_sync_time(self, user_id: int):
         """Sets the timestamp of the last successful sync."""
-        now_ts = datetime.datetime.now(datetime.timezone.utc).timestamp()
-        await self.redis.set(f"sync_last_time:{user_id}", str(now_ts))
+        await self.redis.set(f"sync_last_time:{user_id}", str(time.time()))
 
     async def get_last_sync_time(self, user_id: int) -> Optional[datetime.datetime]:
         """Returns the last successful sync time."""
@@ -83,7 +148,7 @@ class SyncManager:
         return None
 
     def get_task_status(self, task_id: str) -> Dict[str, Any]:
-        """Wrapper around Celery AsyncResult to return clean status.
+        """Returns a clean status dict for a Celery task.
 
         Note: Checking celery status is typically synchronous (checking backend).
         If we wanted fully async, we'd need an async celery backend client,
@@ -91,13 +156,33 @@ class SyncManager:
         However, to be ultra-safe, we keep this method synchronous for now
         as Celery's AsyncResult isn't natively async-awaitable in the way Redis is.
         The blocking call is to the result backend (Redis).
+
+        Results are cached per process for STATUS_CACHE_TTL_SEC while the task
+        is in flight and TERMINAL_STATUS_CACHE_TTL_SEC once it has finished.
         """
-        task_result = AsyncResult(task_id, app=celery_app)
-        return {
+        now = time.monotonic()
+        cached = _status_cache.get(task_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        # One backend read (already decoded); AsyncResult would re-fetch the meta for each of
+        # status/ready/result/info
+        meta = celery_app.backend.get_task_meta(task_id)
+        status = meta["status"]
+        ready = status in states.READY_STATES
+        info = meta.get("result")
+        data = {
             "task_id": task_id,
-            "status": task_result.status,
-            "result": task_result.result if task_result.ready() else None,
-            "info": task_result.info
-            if isinstance(task_result.info, dict)
-            else str(task_result.info),
+            "status": status,
+            "result": info if ready else None,
+            "info": info if isinstance(info, dict) else str(info),
         }
+
+        if len(_status_cache) >= _STATUS_CACHE_MAX_ENTRIES:
+            for key in [k for k, (expires_at, _) in _status_cache.items() if expires_at <= now]:
+                del _status_cache[key]
+            if len(_status_cache) >= _STATUS_CACHE_MAX_ENTRIES:
+                _status_cache.clear()
+        ttl = TERMINAL_STATUS_CACHE_TTL_SEC if ready else STATUS_CACHE_TTL_SEC
+        _status_cache[task_id] = (now + ttl, data)
+        return data
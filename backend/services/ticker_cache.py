@@ -0,0 +1,94 @@
+"""Ticker Cache — shares exchange tickers and market metadata across sync tasks.
+
+Every Binance sync needs the full ticker universe to price balances, and every
+new ccxt exchange instance loads markets before its first call. Both are the
+same for all users, so:
+- per-asset prices derived from the tickers are kept in Redis for a few
+  seconds and shared by all workers;
+- markets are kept in process memory for an hour and attached to new exchange
+  instances with `set_markets`, skipping `load_markets()` round trips.
+"""
+
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class TickerCache:
+    """Redis-backed ticker cache plus an in-process markets cache.
+
+    Implemented as a Singleton class with class-level caching.
+    """
+
+    TICKERS_TTL_SEC = 30
+    MARKETS_TTL_SEC = 3600
+    REDIS_PREFIX = "quote_prices:"
+
+    # exchange id -> (loaded_at monotonic, markets, currencies)
+    _markets: Dict[str, Tuple[float, Dict[str, Any], Optional[Dict[str, Any]]]] = {}
+
+    @classmethod
+    async def get_quote_prices(
+        cls,
+        redis: Optional[Redis],
+        exchange_id: str,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        quotes: Sequence[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Returns {base: {"last", "percentage"}} from Redis, refreshing via `fetch` on a miss.
+
+        Each base asset is priced from its first pair in `quotes` order that has a
+        last price, so callers need a single lookup per asset. Only this table is
+        cached, which keeps the payload a fraction of the raw ccxt ticker dict.
+        """
+        key = f"{cls.REDIS_PREFIX}{exchange_id}"
+        if redis is not None:
+            try:
+                cached = await redis.get(key)
+                if cached:
+                    return orjson.loads(cached)
+            except RedisError as e:
+                logger.debug(f"Ticker cache unavailable: {e}")
+
+        prices = _best_quote_prices(await fetch(), quotes)
+
+        if redis is not None:
+            try:
+                await redis.set(key, orjson.dumps(prices), ex=cls.TICKERS_TTL_SEC)
+            except RedisError as e:
+                logger.debug(f"Ticker cache unavailable: {e}")
+        return prices
+
+    @classmethod
+    async def prepare_markets(cls, exchange) -> None:
+        """Attaches cached markets to a fresh exchange instance, loading them once per TTL."""
+        exchange_id = exchange.id
+        cached = cls._markets.get(exchange_id)
+        if cached is not None and time.monotonic() - cached[0] < cls.MARKETS_TTL_SEC:
+            _, markets, currencies = cached
+            exchange.set_markets(markets, currencies)
+            return
+
+        await exchange.load_markets()
+        cls._markets[exchange_id] = (time.monotonic(), exchange.markets, exchange.currencies)
+
+
+def _best_quote_prices(tickers: Dict[str, Any], quotes: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+    """Builds the base -> price table in one pass over the tickers, honouring `quotes` priority."""
+    rank = {quote: i for i, quote in enumerate(quotes)}
+    best: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+    for pair, ticker in tickers.items():
+        base, _, quote = pair.partition("/")
+        quote_rank = rank.get(quote)
+        if quote_rank is None or ticker.get("last") is None:
+            continue
+        current = best.get(base)
+        if current is None or quote_rank < current[0]:
+            best[base] = (quote_rank, {"last": ticker["last"], "percentage": ticker.get("percentage")})
+    return {base: price for base, (_, price) in best.items()}
@@ -1,12 +1,84 @@
 """Trading212 API client implementation."""
 
+import asyncio
 import httpx
-from typing import List, Dict, Any, Optional
+import orjson
+import time
+from typing import List, Dict, Any, Optional, Tuple
 import logging
+from weakref import WeakKeyDictionary
+
+from tenacity import (
+    retry,
+    stop_after_attempt,
+    wait_exponential,
+    retry_if_exception_type,
+)
 
 logger = logging.getLogger(__name__)
 
 
+# T212 ticker suffix -> suffix used by other APIs, longest first so _US_EQ wins over _EQ
+_TICKER_SUFFIXES = (
+    ("_US_EQ", ""),
+    ("_LSE", ".L"),
+    ("_DE", ".DE"),
+    ("_EQ", ""),
+)
+
+
+def _wait_trading212_ratelimit(retry_state):
+    """Custom wait strategy for Trading212 429 errors."""
+    last_exception = retry_state.outcome.exception()
+    if isinstance(last_exception, httpx.HTTPStatusError) and last_exception.response.status_code == 429:
+        # 1. Try standard Retry-After
+        retry_after = last_exception.response.headers.get("Retry-After")
+        if retry_after:
+            logger.warning(f"Trading212 Rate Limit: Standard Retry-After {retry_after}s")
+            return float(retry_after)
+
+        # 2. Try x-ratelimit-reset (Unix Timestamp)
+        reset_time = last_exception.response.headers.get("x-ratelimit-reset")
+        if reset_time:
+            try:
+                wait_seconds = float(reset_time) - time.time()
+                wait_seconds = max(wait_seconds, 2.0)  # Ensure at least 2s
+                logger.warning(f"Trading212 Rate Limit: x-ratelimit-reset. Waiting {wait_seconds:.2f}s")
+                return wait_seconds
+            except ValueError:
+                pass
+
+        # If 429 but no headers, wait a bit longer than usual
+        return 5.0 + wait_exponential(multiplier=1, min=1, max=10)(retry_state)
+
+    # Fallback: Exponential backoff
+    return wait_exponential(multiplier=2, min=2, max=30)(retry_state)
+
+
+# One pooled client per event loop, shared by every Trading212Client so consecutive syncs
+# reuse keep-alive TLS connections; credentials are passed per request
+_shared_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = WeakKeyDictionary()
+
+
+def _shared_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _shared_clients[loop] = httpx.AsyncClient(
+            headers={"Content-Type": "application/json"},
+            timeout=httpx.Timeout(20.0, connect=10.0),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=10, keepalive_expiry=30.0),
+        )
+    return client
+
+
+async def close_shared_client() -> None:
+    """Closes the current event loop's shared client (worker shutdown)."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
 class Trading212Client:
     LIVE_URL = "https://live.trading212.com/api/v0"
     DEMO_URL = "https://demo.trading212.com/api/v0"
@@ -25,85 +97,44 @@ class Trading212Client:
         self.redis = redis_client
 
         self._auth = (self.api_key, self.api_secret)
-        self._headers = {"Content-Type": "application/json"}
-        self._client: Optional[httpx.AsyncClient] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                auth=self._auth,
-                headers=self._headers,
-                timeout=httpx.Timeout(20.0, connect=10.0),
-            )
-        return self._client
+        return _shared_client()
 
     async def close(self):
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        """Nothing to release per instance: connections belong to the shared pool."""
 
-    async def _request(self, method: str, endpoint: str) -> Dict[str, Any]:
-        from tenacity import (
-            retry,
-            stop_after_attempt,
-            wait_exponential,
-            retry_if_exception_type,
-        )
-        import time
-
-        def wait_trading212_ratelimit(retry_state):
-            """Custom wait strategy for Trading212 429 errors."""
-            last_exception = retry_state.outcome.exception()
-            if isinstance(last_exception, httpx.HTTPStatusError) and last_exception.response.status_code == 429:
-                # 1. Try standard Retry-After
-                retry_after = last_exception.response.headers.get("Retry-After")
-                if retry_after:
-                    logger.warning(f"Trading212 Rate Limit: Standard Retry-After {retry_after}s")
-                    return float(retry_after)
-
-                # 2. Try x-ratelimit-reset (Unix Timestamp)
-                reset_time = last_exception.response.headers.get("x-ratelimit-reset")
-                if reset_time:
-                    try:
-                        wait_seconds = float(reset_time) - time.time()
-                        wait_seconds = max(wait_seconds, 2.0)  # Ensure at least 2s
-                        logger.warning(f"Trading212 Rate Limit: x-ratelimit-reset. Waiting {wait_seconds:.2f}s")
-                        return wait_seconds
-                    except ValueError:
-                        pass
-
-                # If 429 but no headers, wait a bit longer than usual
-                return 5.0 + wait_exponential(multiplier=1, min=1, max=10)(retry_state)
-
-            # Fallback: Exponential backoff
-            return wait_exponential(multiplier=2, min=2, max=30)(retry_state)
-
-        @retry(
-            retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.RequestError)),
-            stop=stop_after_attempt(10),
-            wait=wait_trading212_ratelimit,
-            reraise=True,
-        )
-        async def _make_request():
-            client = await self._get_client()
-            url = f"{self.base_url}{endpoint}"
-            try:
-                response = await client.request(method, url)
+    async def __aenter__(self) -> "Trading212Client":
+        return self
 
-                if response.status_code == 429:
-                    logger.warning(f"Trading 212 Rate Limit Hit [{url}]")
-                    response.raise_for_status()
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
 
+    @retry(
+        retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.RequestError)),
+        stop=stop_after_attempt(10),
+        wait=_wait_trading212_ratelimit,
+        reraise=True,
+    )
+    async def _request(self, method: str, endpoint: str) -> Dict[str, Any]:
+        client = await self._get_client()
+        url = f"{self.base_url}{endpoint}"
+        try:
+            response = await client.request(method, url, auth=self._auth)
+
+            if response.status_code == 429:
+                logger.warning(f"Trading 212 Rate Limit Hit [{url}]")
                 response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code != 429:
-                    logger.error(f"Trading 212 API Error [{url}]: {e.response.status_code} - {e.response.text}")
-                raise
-            except Exception as e:
-                logger.error(f"Trading 212 Request Failed [{url}]: {e}")
-                raise
 
-        return await _make_request()
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 429:
+                logger.error(f"Trading 212 API Error [{url}]: {e.response.status_code} - {e.response.text}")
+            raise
+        except Exception as e:
+            logger.error(f"Trading 212 Request Failed [{url}]: {e}")
+            raise
 
     async def validate_keys(self) -> Dict[str, bool]:
         """Validates keys by trying Live then Demo.
@@ -150,25 +181,23 @@ class Trading212Client:
         if not self.redis:
             return await self._request("GET", "/equity/metadata/instruments")
 
-        import json
-        import hashlib
-
-        # 1. Generate cache key based on API Key hash (to isolate users)
-        key_hash = hashlib.md5(self.api_key.encode()).hexdigest()
-        cache_key = f"t212:instruments:{key_hash}"
+        # 1. The instrument universe is the same for every account of an environment,
+        # so one cached copy per environment (live/demo) serves all users
+        environment = "demo" if self.base_url == self.DEMO_URL else "live"
+        cache_key = f"t212:instruments:{environment}"
 
         # 2. Try Cache
         cached_data = await self.redis.get(cache_key)
         if cached_data:
             logger.debug("Returning cached Trading212 instruments")
-            return json.loads(cached_data)
+            return orjson.loads(cached_data)
 
         # 3. Fetch from API
         logger.debug("Fetching Trading212 instruments from API")
         data = await self._request("GET", "/equity/metadata/instruments")
 
         # 4. Save to Cache
-        await self.redis.set(cache_key, json.dumps(data), ex=self.CACHE_TTL_SEC)
+        await self.redis.set(cache_key, orjson.dumps(data), ex=self.CACHE_TTL_SEC)
 
         return data
 
@@ -179,20 +208,33 @@ class Trading212Client:
         """
         return await self._request("GET", "/equity/portfolio")
 
+    async def fetch_all(
+        self,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Fetches cash, account metadata, instruments and positions concurrently.
+
+        Trading212 rate-limits each endpoint separately, so the four requests
+        can be in flight together on the shared client.
+
+        Returns:
+            (cash, metadata, instruments, positions)
+        """
+        cash, metadata, instruments, positions = await asyncio.gather(
+            self.get_account_cash(),
+            self.get_account_metadata(),
+            self.get_instruments(),
+            self.get_open_positions(),
+        )
+        return cash, metadata, instruments, positions
+
     @staticmethod
     def normalize_ticker(ticker: str) -> str:
         """Removes T212 specific suffixes to get a clean ticker useful for other APIs."""
         ticker = ticker.upper()  # Ensure uppercase
 
-        if ticker.endswith("_US_EQ"):
-            return ticker.replace("_US_EQ", "")
-        elif ticker.endswith("_LSE"):
-            return ticker.replace("_LSE", ".L")
-        elif ticker.endswith("_DE"):
-            return ticker.replace("_DE", ".DE")
-        elif ticker.endswith("_EQ"):
-            # Fallback for generic EQ, usually LSE or just raw.
-            # Try stripping it.
-            return ticker.replace("_EQ", "")
+        # Only the trailing suffix is rewritten; a generic _EQ is usually LSE or just raw, so it is stripped
+        for suffix, replacement in _TICKER_SUFFIXES:
+            if ticker.endswith(suffix):
+                return ticker[: -len(suffix)] + replacement
 
         return ticker
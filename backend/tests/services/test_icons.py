@@ -0,0 +1,40 @@
+"""Tests for IconResolver fallback resolution."""
+
+from models.assets import AssetType
+from services.icons import IconResolver
+
+TV = "https://s3-symbol-logo.tradingview.com"
+
+
+def test_brand_priority_follows_brand_list_order():
+    """When several brands appear in a name, the first one in the brand list wins."""
+    url = IconResolver.get_icon_url("XDWD", AssetType.STOCK, "unknown", asset_name="Xtrackers MSCI World (HSBC)")
+    assert url == f"{TV}/hsbc--big.svg"
+
+
+def test_google_maps_to_alphabet():
+    url = IconResolver.get_icon_url("GOOGL", AssetType.STOCK, "unknown", asset_name="Google Class A")
+    assert url == f"{TV}/alphabet--big.svg"
+
+
+def test_name_cleanup_strips_parentheses_and_suffixes():
+    url = IconResolver.get_icon_url("KO", AssetType.STOCK, "unknown", asset_name="Coca-Cola  (Dist) Corp.")
+    assert url == f"{TV}/coca-cola--big.svg"
+
+
+def test_ticker_fallback_when_name_missing():
+    url = IconResolver.get_icon_url("VUSA.L", AssetType.STOCK, "unknown")
+    assert url == f"{TV}/vusa--big.svg"
+
+
+def test_fiat_and_crypto_fallbacks():
+    assert "name=€" in IconResolver.get_icon_url("eur", AssetType.FIAT, "unknown")
+    assert IconResolver.get_icon_url("BTC", AssetType.CRYPTO, "unknown").endswith("/btc.png")
+
+
+def test_provider_strategy_takes_precedence():
+    IconResolver.register_strategy("test-provider", lambda symbol, asset_type, original_ticker: "custom.png")
+    try:
+        assert IconResolver.get_icon_url("AAPL", AssetType.STOCK, "test-provider") == "custom.png"
+    finally:
+        IconResolver._strategies.pop("test-provider", None)
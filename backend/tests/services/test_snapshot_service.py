@@ -0,0 +1,235 @@
+"""Tests for SnapshotService borrow, dedup, failed-commit handling and portfolio total refreshes."""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services import snapshot_service
+from services.snapshot_service import SnapshotService
+
+USER_ID = 7
+
+
+class FakeRedis:
+    """In-memory stand-in for the few Redis commands SnapshotService uses."""
+
+    def __init__(self, data=None):
+        self.data = dict(data or {})
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def _exists(self, key):
+        return int(key in self.data)
+
+    def _scard(self, key):
+        return len(self.data.get(key, ()))
+
+    def _get(self, key):
+        return self.data.get(key)
+
+    def _set(self, key, value, ex=None):
+        self.data[key] = value
+        return True
+
+    def _incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def _decr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) - 1)
+        return int(self.data[key])
+
+    def _expire(self, key, seconds):
+        return int(key in self.data)
+
+    def _delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self._commands.append((name, args, kwargs))
+
+    async def execute(self):
+        return [getattr(self._redis, f"_{name}")(*args, **kwargs) for name, args, kwargs in self._commands]
+
+
+def make_redis(counter=0, recent_id=None):
+    """Redis with a warm completeness cache: one active integration, already synced."""
+    data = {
+        f"synced_integrations:{USER_ID}": {"1"},
+        f"active_integrations_count:{USER_ID}": "1",
+        f"snap_counter:{USER_ID}": str(counter),
+    }
+    if recent_id is not None:
+        data[f"snapshot_dedup:{USER_ID}"] = str(recent_id)
+    return FakeRedis(data)
+
+
+def make_db():
+    db = MagicMock()
+    db.commit = AsyncMock()
+    db.scalar = AsyncMock()
+    return db
+
+
+def create(service, db, counter_at_entry):
+    return asyncio.run(
+        service._create_snapshot_under_lock(
+            db, USER_ID, new_assets_count=2, counter_at_entry=counter_at_entry, hint_total_usd=100.0
+        )
+    )
+
+
+def test_borrows_snapshot_started_after_entry():
+    """Two snapshots since entry: the second began after our data was committed."""
+    recent_id = uuid.uuid4()
+    db = make_db()
+    db.scalar.return_value = recent_id
+    assert create(SnapshotService(make_redis(counter=5, recent_id=recent_id)), db, counter_at_entry=3) is None
+    db.add.assert_not_called()
+    db.commit.assert_not_awaited()
+
+
+def test_does_not_borrow_snapshot_that_never_committed():
+    """Keys bumped by a snapshot whose commit failed, read before they were reverted."""
+    redis = make_redis(counter=5, recent_id=uuid.uuid4())
+    db = make_db()
+    db.scalar.return_value = None  # neither the borrow check nor the dedup update finds the row
+
+    snapshot = create(SnapshotService(redis), db, counter_at_entry=3)
+
+    db.add.assert_called_once_with(snapshot)
+    db.commit.assert_awaited_once()
+    assert redis.data[f"snapshot_dedup:{USER_ID}"] == str(snapshot.id)
+
+
+def test_one_concurrent_snapshot_is_not_borrowed():
+    """A single snapshot since entry may have read the data before ours was committed."""
+    redis = make_redis(counter=4)
+    db = make_db()
+    snapshot = create(SnapshotService(redis), db, counter_at_entry=3)
+
+    db.add.assert_called_once_with(snapshot)
+    db.commit.assert_awaited_once()
+    assert redis.data[f"snapshot_dedup:{USER_ID}"] == str(snapshot.id)
+    assert redis.data[f"snap_counter:{USER_ID}"] == "5"
+
+
+def test_updates_snapshot_inside_dedup_window():
+    recent_id = uuid.uuid4()
+    redis = make_redis(counter=1, recent_id=recent_id)
+    db = make_db()
+    updated = MagicMock(id=recent_id)
+    db.scalar.return_value = updated
+
+    assert create(SnapshotService(redis), db, counter_at_entry=1) is updated
+    db.add.assert_not_called()
+    assert redis.data[f"snapshot_dedup:{USER_ID}"] == str(recent_id)
+    assert redis.data[f"snap_counter:{USER_ID}"] == "2"
+
+
+def test_failed_commit_reverts_dedup_and_counter():
+    redis = make_redis(counter=3)
+    db = make_db()
+    db.commit.side_effect = RuntimeError("connection lost")
+
+    with pytest.raises(RuntimeError):
+        create(SnapshotService(redis), db, counter_at_entry=3)
+
+    assert f"snapshot_dedup:{USER_ID}" not in redis.data
+    assert redis.data[f"snap_counter:{USER_ID}"] == "3"
+
+    # A waiter that entered before the failed attempt must not borrow it
+    waiter_db = make_db()
+    assert create(SnapshotService(redis), waiter_db, counter_at_entry=2) is not None
+    waiter_db.commit.assert_awaited_once()
+
+
+class FakeTotalsDatabase:
+    """unified_assets sums and user_portfolio_totals with Postgres READ COMMITTED semantics.
+
+    Each statement reads the data committed when it starts plus its own transaction's
+    writes; locks (the advisory lock and the totals row lock) are held until commit.
+    """
+
+    def __init__(self):
+        self.committed = {}  # integration -> usd sum
+        self.total = None
+        self.advisory_lock = asyncio.Lock()
+        self.row_lock = asyncio.Lock()
+
+    def session(self):
+        return _FakeTotalsSession(self)
+
+
+class _FakeTotalsSession:
+    def __init__(self, database):
+        self._db = database
+        self._assets = {}
+        self._total = None
+        self._held = []
+
+    def write_assets(self, integration, usd_value):
+        self._assets[integration] = usd_value
+
+    async def flush(self):
+        pass
+
+    async def _hold(self, lock):
+        await lock.acquire()
+        self._held.append(lock)
+
+    async def execute(self, statement, params):
+        if statement is snapshot_service._STMT_LOCK_TOTAL:
+            await self._hold(self._db.advisory_lock)
+        elif statement is snapshot_service._STMT_REFRESH_TOTAL:
+            total = sum({**self._db.committed, **self._assets}.values())
+            if self._db.row_lock not in self._held:
+                await self._hold(self._db.row_lock)
+            self._total = total
+        else:
+            raise AssertionError(f"unexpected statement {statement}")
+
+    async def commit(self):
+        self._db.committed.update(self._assets)
+        if self._total is not None:
+            self._db.total = self._total
+        for lock in self._held:
+            lock.release()
+        self._held = []
+
+
+def test_concurrent_total_refreshes_include_both_rewrites():
+    """Two syncs of different integrations of one user: the later refresh sees the earlier rows."""
+    database = FakeTotalsDatabase()
+    database.committed = {"binance": 10.0, "t212": 20.0}
+
+    async def sync(integration, usd_value):
+        db = database.session()
+        db.write_assets(integration, usd_value)
+        await SnapshotService.refresh_portfolio_total(db, USER_ID)
+        await asyncio.sleep(0)  # the rest of the sync (price history, ...) before the commit
+        await db.commit()
+
+    async def run():
+        await asyncio.gather(sync("binance", 100.0), sync("t212", 200.0))
+
+    asyncio.run(run())
+    assert database.total == 300.0
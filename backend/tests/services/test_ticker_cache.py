@@ -0,0 +1,24 @@
+"""Tests for the ticker -> per-asset price table."""
+
+from services.ticker_cache import _best_quote_prices
+
+QUOTES = ("USDT", "USDC", "EUR")
+
+
+def test_preferred_quote_wins_regardless_of_ticker_order():
+    tickers = {
+        "BTC/EUR": {"last": 90.0, "percentage": 1.0},
+        "BTC/USDC": {"last": 99.0, "percentage": 2.0},
+        "BTC/USDT": {"last": 100.0, "percentage": 3.0},
+    }
+    assert _best_quote_prices(tickers, QUOTES) == {"BTC": {"last": 100.0, "percentage": 3.0}}
+
+
+def test_skips_unknown_quotes_and_missing_prices():
+    tickers = {
+        "ETH/BTC": {"last": 0.05},
+        "ETH/USDT": {"last": None},
+        "ETH/USDC": {"last": 2000.0},
+        "BTC/USDT:USDT": {"last": 1.0},
+    }
+    assert _best_quote_prices(tickers, QUOTES) == {"ETH": {"last": 2000.0, "percentage": None}}
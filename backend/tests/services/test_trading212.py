@@ -0,0 +1,20 @@
+"""Tests for Trading212Client ticker normalization."""
+
+import pytest
+
+from services.trading212 import Trading212Client
+
+
+@pytest.mark.parametrize(
+    ("ticker", "expected"),
+    [
+        ("AAPL_US_EQ", "AAPL"),
+        ("vusa_lse", "VUSA.L"),
+        ("SAP_DE", "SAP.DE"),
+        ("VUSAl_EQ", "VUSAL"),
+        ("BRK.B", "BRK.B"),
+        ("DE_LSE", "DE.L"),
+    ],
+)
+def test_normalize_ticker(ticker, expected):
+    assert Trading212Client.normalize_ticker(ticker) == expected
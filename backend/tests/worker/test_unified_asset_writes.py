@@ -0,0 +1,110 @@
+"""Tests for the diffed unified_assets rewrite in the sync task."""
+
+import asyncio
+import uuid
+from decimal import ROUND_HALF_UP, Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from models.assets import AssetType
+from worker import tasks
+
+USER_ID = 7
+INTEGRATION_ID = uuid.uuid4()
+
+
+def make_record(symbol, amount, price=100.0, change=1.5):
+    """A sync record in _UNIFIED_ASSET_COPY_COLUMNS order, as built by _run_sync."""
+    return (
+        uuid.uuid4(),
+        USER_ID,
+        INTEGRATION_ID,
+        symbol,
+        symbol,
+        symbol,
+        AssetType.CRYPTO.name,
+        None,
+        amount,
+        "USD",
+        price,
+        change,
+        amount * price,
+        None,
+    )
+
+
+def stored_row(record):
+    """The row Postgres returns for `record`: Numeric columns rounded half away from zero to their scale."""
+    values = dict(zip(tasks._ASSET_DATA_COLUMNS, record[3:]))
+    for column, scale in tasks._ASSET_NUMERIC_SCALES.items():
+        values[column] = Decimal(str(values[column])).quantize(Decimal(1).scaleb(-scale), ROUND_HALF_UP)
+    values["asset_type"] = AssetType[values["asset_type"]]
+    return SimpleNamespace(id=uuid.uuid4(), **values)
+
+
+@pytest.fixture
+def copied(monkeypatch):
+    rows = []
+
+    async def fake_copy(db, records):
+        rows.extend(records)
+
+    monkeypatch.setattr(tasks, "_copy_unified_assets", fake_copy)
+    return rows
+
+
+def write(existing, records):
+    """Runs _write_unified_assets; returns the (statement, params) pairs it executed after the SELECT."""
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=[existing] + [None] * 10)
+    asyncio.run(tasks._write_unified_assets(db, INTEGRATION_ID, records))
+    assert db.execute.await_args_list[0].args[0] is tasks._STMT_INTEGRATION_ASSETS
+    return [call.args for call in db.execute.await_args_list[1:]]
+
+
+def test_float_rounding_alone_is_not_an_update(copied):
+    record = make_record("BTC", 0.123456789, price=64123.123456789, change=2.345)
+    assert write([stored_row(record)], [record]) == []
+    assert copied == []
+
+
+def test_changed_row_is_updated_in_place(copied):
+    row = stored_row(make_record("BTC", 1.0))
+    record = make_record("BTC", 2.0)
+
+    (statement, params), *rest = write([row], [record])
+
+    assert statement is tasks._STMT_UPDATE_ASSET and rest == []
+    assert params == [{"asset_id": row.id, **{f"v_{c}": v for c, v in zip(tasks._ASSET_DATA_COLUMNS, record[3:])}}]
+    assert copied == []
+
+
+def test_duplicate_symbols_are_matched_in_order(copied):
+    first, second = make_record("BTC", 1.0), make_record("BTC", 2.0)
+    rows = [stored_row(first), stored_row(second)]
+    changed_second = make_record("BTC", 3.0)
+    extra = make_record("BTC", 4.0)
+
+    (statement, params), *rest = write(rows, [first, changed_second, extra])
+
+    assert statement is tasks._STMT_UPDATE_ASSET and rest == []
+    assert [p["asset_id"] for p in params] == [rows[1].id]
+    assert copied == [extra]
+
+
+def test_vanished_rows_are_deleted(copied):
+    kept = make_record("BTC", 1.0)
+    gone = stored_row(make_record("ETH", 5.0))
+
+    assert write([stored_row(kept), gone], [kept]) == [(tasks._STMT_DELETE_ASSETS, {"asset_ids": [gone.id]})]
+    assert copied == []
+
+
+def test_new_rows_go_to_copy(copied):
+    kept = make_record("BTC", 1.0)
+    new = make_record("SOL", 10.0)
+
+    assert write([stored_row(kept)], [kept, new]) == []
+    assert copied == [new]
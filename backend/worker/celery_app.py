@@ -6,8 +6,10 @@ from celery.schedules import crontab
 
 # Get Redis URL from env or default
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+# Results can live in their own Redis DB (e.g. redis://.../1) so they don't share keyspace with the broker
+RESULT_BACKEND_URL = os.getenv("CELERY_RESULT_BACKEND", REDIS_URL)
 
-celery_app = Celery("worker", broker=REDIS_URL, backend=REDIS_URL, include=["worker.tasks"])
+celery_app = Celery("worker", broker=REDIS_URL, backend=RESULT_BACKEND_URL, include=["worker.tasks"])
 
 # Celery Beat Schedule
 celery_app.conf.beat_schedule = {
@@ -35,6 +37,22 @@ celery_app.conf.update(
     worker_prefetch_multiplier=1,
     worker_send_task_events=True,
     task_send_sent_event=True,
+    # Results are only polled while the UI waits on a sync; keep them small and short-lived
+    result_compression="gzip",
+    result_expires=3600,
+    result_backend_transport_options={
+        "global_keyprefix": "cel:",
+        "socket_keepalive": True,
+        "retry_on_timeout": True,
+    },
+    # Portfolio syncs are I/O bound and latency sensitive; keep them on their own queue so
+    # CPU-heavy analytics tasks can't hold them up and sync workers can be scaled separately
+    task_routes={
+        "sync_integration_data": {"queue": "sync"},
+        "sync_integration_batch": {"queue": "sync"},
+        "trigger_global_sync": {"queue": "sync"},
+        "create_snapshots_batch": {"queue": "sync"},
+    },
 )
 
 # This environment variable bypasses the "Never call result.get() within a task" check
@@ -6,22 +6,31 @@ and scheduled cleanup tasks.
 
 import asyncio
 import httpx
+import orjson
 import json
 import logging
 import datetime
+import hashlib
 import sys
 import os
+import numpy as np
 import pandas as pd
 import time
+from collections import defaultdict, deque
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, Optional, Tuple
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from uuid import UUID
-from sqlalchemy import select, delete
+from uuid import UUID, uuid4
+from celery import chord
+from celery.signals import worker_process_init, worker_process_shutdown
+from sqlalchemy import Interval, bindparam, func, literal, select, delete, update
+from redis.exceptions import RedisError
 
 
 from worker.celery_app import celery_app
-from core.database import get_async_sessionmaker, get_async_engine, dispose_loop_engine
+from core.database import get_async_sessionmaker, get_async_engine, dispose_loop_engine, configure_engine_pool
 from core.redis import get_redis_client, close_redis_client
 
 from models.user import User  # noqa: F401
@@ -30,94 +39,336 @@ from models.integration import Integration, ProviderID
 from core.security.encryption import encryption_service
 from core.config import settings
 from services.currency import currency_service
-from services.price_service import PriceTrackingService
+from services.price_service import PriceTrackingService, PriceTick
 from services.distributed_lock import LockManager
 from services.snapshot_service import SnapshotService
+from services.sync_manager import SYNC_PENDING_PREFIX, SYNC_PENDING_TTL_SEC, release_sync_pending
 
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip when scanning active integrations for the global sync
+GLOBAL_SYNC_FETCH_BATCH = 1000
+# Rows per UPDATE executemany / DELETE ... IN statement when rewriting an integration's assets
+ASSET_WRITE_BATCH = 1000
+# Fingerprint of the last committed asset rows per integration; bounded so stray
+# out-of-band edits to unified_assets are overwritten within the hour
+_ASSET_DIGEST_PREFIX = "sync_digest:"
+ASSET_DIGEST_TTL_SEC = 3600
+# Global sync: integrations per sync_integration_batch task, and how many of them run at once.
+# Two waves of SYNC_BATCH_CONCURRENCY keep a batch well inside its time limit, which must stay
+# below SYNC_PENDING_TTL_SEC so queued integrations keep their single-flight marker.
+SYNC_BATCH_SIZE = 16
+SYNC_BATCH_CONCURRENCY = 8
+SYNC_BATCH_TIME_LIMIT_SEC = 600
+# Retries of a sync_integration_data task rate limited by its provider (429)
+SYNC_RATE_LIMIT_MAX_RETRIES = 5
+# Rows removed per transaction by cleanup_price_history
+PRICE_HISTORY_DELETE_BATCH = 10000
+PRICE_HISTORY_DELETE_PAUSE_SEC = 0.05
+# Progress updates closer together than this are dropped (terminal stages always go through)
+PROGRESS_MIN_INTERVAL_SEC = 0.25
+_PROGRESS_TERMINAL_STAGES = frozenset({"DONE", "ERROR"})
+# task id -> monotonic time of its last published progress update
+_progress_sent_at: Dict[str, float] = {}
+# Decrypted credentials per integration, reused while the stored ciphertext is unchanged
+CREDENTIALS_CACHE_TTL_SEC = 300
+CREDENTIALS_CACHE_MAX_SIZE = 1024
+# integration id -> (monotonic expiry, ciphertext, credentials)
+_credentials_cache: Dict[str, Tuple[float, str, dict]] = {}
+
+# Providers whose integrations are synced by the worker
+_SYNC_PROVIDERS = frozenset({ProviderID.binance, ProviderID.trading212, ProviderID.freedom24})
+
+# --- Prebuilt statements ---
+# Built once at import; the sync path only binds parameters, so no per-run statement construction.
+_STMT_LOAD_INTEGRATION = select(Integration).where(Integration.id == bindparam("integration_id"))
+# The retention cutoff is computed by Postgres from its own clock
+_PRICE_HISTORY_CUTOFF = func.now() - literal(datetime.timedelta(hours=settings.PRICE_HISTORY_KEEP_HOURS), Interval)
+_STMT_DELETE_OLD_PRICES = delete(MarketPriceHistory).where(
+    MarketPriceHistory.id.in_(
+        select(MarketPriceHistory.id)
+        .where(MarketPriceHistory.timestamp < _PRICE_HISTORY_CUTOFF)
+        .limit(PRICE_HISTORY_DELETE_BATCH)
+        .scalar_subquery()
+    )
+)
+
+
+# === Worker Event Loop ===
+#
+# Every task of a worker process runs on one long-lived event loop, so the
+# loop-bound engine and Redis pool (see core.database / core.redis) survive
+# between tasks instead of reconnecting to Postgres and Redis on every run.
+
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_async(coro):
+    """Runs a coroutine to completion on this process's persistent event loop."""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop.run_until_complete(coro)
+
+
+@worker_process_init.connect
+def _init_worker_process(**kwargs):
+    """Sizes the pool for a single worker process and starts its event loop."""
+    global _worker_loop
+    configure_engine_pool(pool_size=settings.WORKER_DB_POOL_SIZE, max_overflow=settings.WORKER_DB_MAX_OVERFLOW)
+    # The loop may have been inherited from the parent on fork; never share it
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+
+
+@worker_process_shutdown.connect
+def _shutdown_worker_process(**kwargs):
+    """Closes this process's connections and event loop."""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        return
+
+    async def _close_connections():
+        from adapters.factory import AdapterFactory
 
-async def sync_integration_data_async(integration_id: str, task_instance=None):
+        await AdapterFactory.close_all()
+        await dispose_loop_engine()
+        await close_redis_client()
+
+    _worker_loop.run_until_complete(_close_connections())
+    _worker_loop.close()
+    _worker_loop = None
+
+
+async def sync_integration_data_async(integration_id: str, task_instance=None, create_snapshot: bool = True):
     """Syncs data for a single integration.
 
     Guarantees:
     - Only one sync per integration at a time (DistributedLock)
-    - Asset DELETE + INSERT operations are atomic (single transaction)
+    - Asset writes are atomic (single transaction)
     - Portfolio Snapshot is created ONLY AFTER data commit
+
+    With `create_snapshot=False` (scheduled global sync) the snapshot is left
+    to `create_snapshots_batch`, which runs once all syncs have finished.
     """
     logger.info(f"Starting sync for integration {integration_id}")
     _update_progress(task_instance, 5, "INIT", "Initializing sync...")
 
     redis_client = get_redis_client()
     lock_manager = LockManager(redis_client)
-    snapshot_service = SnapshotService(lock_manager)
+    snapshot_service = SnapshotService(redis_client)
+
+    # Keyed by integration only, so the wait can start while the integration is still loading
+    sync_lock = lock_manager.sync_lock(integration_id, ttl_sec=settings.SYNC_LOCK_TTL_SEC)
+    lock_wait = asyncio.create_task(sync_lock.acquire(timeout_sec=settings.SYNC_WAIT_MAX_SEC))
 
     session_factory = get_async_sessionmaker()
-    try:
-        integration, creds = await _load_integration(session_factory, integration_id)
+    # One session for the whole sync; it only holds a connection while a transaction is open
+    async with session_factory() as db:
+        try:
+            integration, creds = await _load_integration(db, integration_id)
+            # End the read transaction so no connection is held while the exchange is queried
+            await db.commit()
+        except BaseException:
+            await _abandon_lock_wait(lock_wait, sync_lock)
+            raise
         if integration is None or creds is None:
+            await _abandon_lock_wait(lock_wait, sync_lock)
             return
 
         user_id = integration.user_id
 
-        sync_lock = lock_manager.sync_lock(user_id, integration_id, ttl_sec=settings.SYNC_LOCK_TTL_SEC)
-
-        if not await sync_lock.acquire(timeout_sec=settings.SYNC_WAIT_MAX_SEC):
+        if not await lock_wait:
             logger.info(f"Sync lock wait expired for user {user_id}. Assuming parallel task completed.")
             _update_progress(task_instance, 100, "DONE", "Synced (via parallel task)")
             return
 
+        # Slow providers can outlive the lock TTL; keep it alive while we work
+        sync_lock.start_watchdog()
         try:
-            await _run_sync(session_factory, integration, creds, task_instance, snapshot_service, redis_client)
+            await _run_sync(db, integration, creds, task_instance, snapshot_service, redis_client, create_snapshot)
         finally:
             await sync_lock.release()
 
-    finally:
-        # Crucial for Celery + Asyncio: dispose the engine for the CURRENT loop
-        # to prevent cross-loop contamination and memory leaks.
-        await dispose_loop_engine()
+
+async def _abandon_lock_wait(lock_wait: asyncio.Task, sync_lock):
+    """Stops a pending lock acquisition, releasing the lock if it was taken in the meantime."""
+    lock_wait.cancel()
+    try:
+        await lock_wait
+    except asyncio.CancelledError:
+        pass
+    if sync_lock.acquired:
+        await sync_lock.release()
 
 
-async def _load_integration(session_factory, integration_id: str):
+async def _load_integration(db, integration_id: str):
     """Loads the integration from the DB and decrypts credentials.
 
     Returns:
         (Integration, dict) or (None, None) on error.
     """
-    async with session_factory() as db:
-        result = await db.execute(select(Integration).where(Integration.id == UUID(integration_id)))
-        integration = result.scalar_one_or_none()
+    result = await db.execute(_STMT_LOAD_INTEGRATION, {"integration_id": UUID(integration_id)})
+    integration = result.scalar_one_or_none()
 
-        if not integration:
-            logger.error(f"Integration {integration_id} not found")
-            return None, None
+    if not integration:
+        logger.error(f"Integration {integration_id} not found")
+        return None, None
 
-        if integration.provider_id not in [
-            ProviderID.binance,
-            ProviderID.trading212,
-            ProviderID.freedom24,
-        ]:
-            logger.warning(f"Provider {integration.provider_id} not supported for sync yet")
-            return None, None
+    if integration.provider_id not in _SYNC_PROVIDERS:
+        logger.warning(f"Provider {integration.provider_id} not supported for sync yet")
+        return None, None
 
-        try:
-            # FIXED: Handle string return type from mock decryption service
-            decrypted_json = encryption_service.decrypt(integration.credentials)
-            creds = json.loads(decrypted_json)
-        except Exception as e:
-            logger.error(f"Failed to decrypt credentials: {e}")
-            return None, None
+    try:
+        creds = await _decrypt_credentials(integration_id, integration.credentials)
+    except Exception as e:
+        logger.error(f"Failed to decrypt credentials: {e}")
+        return None, None
 
-        return integration, creds
+    return integration, creds
 
 
-async def _run_sync(session_factory, integration, creds, task_instance, snapshot_service, redis_client):
+async def _decrypt_credentials(integration_id: str, ciphertext: str) -> dict:
+    """Decrypts and parses credentials, served from the in-process cache when possible.
+
+    Entries are keyed by the ciphertext as well, so editing an integration's
+    credentials invalidates its entry without any explicit signal.
+    """
+    now = time.monotonic()
+    cached = _credentials_cache.get(integration_id)
+    if cached is not None and cached[0] > now and cached[1] == ciphertext:
+        return dict(cached[2])
+
+    # FIXED: Handle string return type from mock decryption service
+    decrypted_json = await asyncio.to_thread(encryption_service.decrypt, ciphertext)
+    creds = orjson.loads(decrypted_json)
+
+    _credentials_cache.pop(integration_id, None)
+    if len(_credentials_cache) >= CREDENTIALS_CACHE_MAX_SIZE:
+        # Oldest insertion first
+        del _credentials_cache[next(iter(_credentials_cache))]
+    _credentials_cache[integration_id] = (now + CREDENTIALS_CACHE_TTL_SEC, ciphertext, creds)
+    return dict(creds)
+
+
+_UNIFIED_ASSET_COPY_COLUMNS = (
+    "id",
+    "user_id",
+    "integration_id",
+    "symbol",
+    "name",
+    "original_name",
+    "asset_type",
+    "isin",
+    "amount",
+    "currency",
+    "current_price",
+    "change_24h",
+    "usd_value",
+    "image_url",
+)
+
+
+# Everything after the identity columns; compared to decide whether a row changed
+_ASSET_DATA_COLUMNS = _UNIFIED_ASSET_COPY_COLUMNS[3:]
+# Numeric column scales, so freshly computed floats compare equal to what Postgres stored
+_ASSET_NUMERIC_SCALES = {"amount": 8, "current_price": 8, "change_24h": 2, "usd_value": 8}
+
+_assets_table = UnifiedAsset.__table__
+_STMT_INTEGRATION_ASSETS = select(_assets_table.c.id, *(_assets_table.c[c] for c in _ASSET_DATA_COLUMNS)).where(
+    _assets_table.c.integration_id == bindparam("integration_id")
+)
+_STMT_UPDATE_ASSET = (
+    update(_assets_table)
+    .where(_assets_table.c.id == bindparam("asset_id"))
+    .values({**{c: bindparam(f"v_{c}") for c in _ASSET_DATA_COLUMNS}, "last_updated": func.now()})
+)
+_STMT_DELETE_ASSETS = delete(_assets_table).where(_assets_table.c.id.in_(bindparam("asset_ids", expanding=True)))
+
+
+def _assets_digest(records) -> str:
+    """Fingerprint of a sync's asset rows, ignoring their freshly generated ids."""
+    payload = orjson.dumps(sorted((record[3:] for record in records), key=lambda data: data[0]))
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _normalize_asset_value(column: str, value):
+    if column == "asset_type" and value is not None:
+        return getattr(value, "name", value)
+    scale = _ASSET_NUMERIC_SCALES.get(column)
+    if scale is None or value is None:
+        return value
+    return Decimal(str(value)).quantize(Decimal(1).scaleb(-scale), rounding=ROUND_HALF_UP)
+
+
+async def _write_unified_assets(db, integration_id, records) -> None:
+    """Brings an integration's unified_assets in line with `records` (COPY column order).
+
+    Instead of deleting and re-inserting every row each sync, rows are matched by
+    symbol: unchanged rows are left alone, changed ones are updated in place (one
+    executemany), new ones are COPYed and vanished ones deleted. Row ids stay stable
+    and the WAL only carries actual changes.
+    """
+    existing = defaultdict(deque)
+    for row in await db.execute(_STMT_INTEGRATION_ASSETS, {"integration_id": integration_id}):
+        existing[row.symbol].append(row)
+
+    to_insert = []
+    to_update = []
+    for record in records:
+        values = dict(zip(_ASSET_DATA_COLUMNS, record[3:]))
+        matches = existing.get(values["symbol"])
+        if not matches:
+            to_insert.append(record)
+            continue
+        current = matches.popleft()
+        if any(
+            _normalize_asset_value(c, getattr(current, c)) != _normalize_asset_value(c, values[c])
+            for c in _ASSET_DATA_COLUMNS
+        ):
+            to_update.append({"asset_id": current.id, **{f"v_{c}": v for c, v in values.items()}})
+
+    to_delete = [row.id for rows in existing.values() for row in rows]
+    # Bounded statements: an expanding IN list takes one bind parameter per id
+    # (Postgres caps a statement at 32767), and executemany batches stay small
+    for batch in _chunks(to_delete, ASSET_WRITE_BATCH):
+        await db.execute(_STMT_DELETE_ASSETS, {"asset_ids": batch})
+    for batch in _chunks(to_update, ASSET_WRITE_BATCH):
+        await db.execute(_STMT_UPDATE_ASSET, batch)
+    if to_insert:
+        await _copy_unified_assets(db, to_insert)
+    logger.debug(
+        f"Integration {integration_id} assets: {len(to_insert)} inserted, {len(to_update)} updated, "
+        f"{len(to_delete)} deleted, {len(records) - len(to_insert) - len(to_update)} unchanged"
+    )
+
+
+async def _copy_unified_assets(db, records):
+    """Streams asset rows into unified_assets with a single binary COPY.
+
+    Runs on the session's own asyncpg connection, so the rows land in the same
+    transaction as the surrounding writes. `last_updated` is filled by its server default.
+    """
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        UnifiedAsset.__tablename__, records=records, columns=_UNIFIED_ASSET_COPY_COLUMNS
+    )
+
+
+async def _run_sync(db, integration, creds, task_instance, snapshot_service, redis_client, create_snapshot=True):
     """Executes the main sync logic.
 
     Steps:
     1. Fetch data via Adapter.
-    2. Atomic DELETE + INSERT in a single transaction.
+    2. Price history + atomic asset rewrite (diffed UPDATE/INSERT/DELETE) in a single transaction.
     3. Snapshot creation after commit.
     """
     user_id = integration.user_id
@@ -128,7 +379,10 @@ async def _run_sync(session_factory, integration, creds, task_instance, snapshot
 
     try:
         adapter = AdapterFactory.get_adapter(integration.provider_id)
-        assets_data = await adapter.fetch_balances(creds, integration.settings)
+        # A stale rate table is refreshed while the exchange request is in flight
+        assets_data, _ = await asyncio.gather(
+            adapter.fetch_balances(creds, integration.settings), currency_service.prefetch_rates()
+        )
     except Exception as e:
         logger.error(f"Adapter Sync Error: {e}")
         _update_progress(task_instance, 0, "ERROR", str(e))
@@ -137,80 +391,125 @@ async def _run_sync(session_factory, integration, creds, task_instance, snapshot
     _update_progress(task_instance, 60, "PROCESSING", f"Processing {len(assets_data)} assets...")
 
     new_assets = []
-    total_portfolio_value = 0.0
-
-    async with session_factory() as price_db:
-        # Needs to be wrapped in transaction, but some services explicitly commit
-        async with price_db.begin():
-            # Price tracking logic requires its own handling, but wait,
-            # PriceTrackingService does autocommit originally? Let's assume it doesn't.
-            pass
-
-        # Okay actually, price_db was used sequentially, let's keep it simple
-        for ad in assets_data:
-            rate = await currency_service.get_rate(ad.currency, settings.BASE_CURRENCY)
-            price_native = float(ad.price)
-            price_usd = price_native * rate
-            usd_value = float(ad.amount) * price_usd
-            total_portfolio_value += usd_value
-
-            await PriceTrackingService.record_price(
-                price_db,
+    # One clock reading for the whole cycle keeps throttling and 24h anchors consistent
+    cycle_now = datetime.datetime.now(datetime.timezone.utc)
+
+    # Assets share a handful of currencies: resolve each rate once
+    rates = await currency_service.get_rates_bulk((ad.currency for ad in assets_data), settings.BASE_CURRENCY)
+
+    # Valuation for the whole batch as array ops; tolist() hands plain floats to the DB layer
+    count = len(assets_data)
+    amounts = np.fromiter((float(ad.amount) for ad in assets_data), dtype=np.float64, count=count)
+    prices_native = np.fromiter((float(ad.price) for ad in assets_data), dtype=np.float64, count=count)
+    fx_rates = np.fromiter((rates[ad.currency] for ad in assets_data), dtype=np.float64, count=count)
+    prices_usd = prices_native * fx_rates
+    usd_values = amounts * prices_usd
+    total_portfolio_value = float(usd_values.sum())
+
+    price_ticks = [
+        PriceTick(ad.symbol, integration.provider_id, price_usd, settings.BASE_CURRENCY)
+        for ad, price_usd in zip(assets_data, prices_usd.tolist())
+    ]
+    priced = list(zip(assets_data, usd_values.tolist()))
+
+    # One MGET + one history query for all 24h changes instead of a lookup per asset;
+    # the last committed fingerprint is read from Redis while the history query runs
+    digest_key = f"{_ASSET_DIGEST_PREFIX}{integration.id}"
+    changes, stored_digest = await asyncio.gather(
+        PriceTrackingService.calculate_24h_changes_bulk(
+            db, integration.provider_id, {t.symbol: t.price for t in price_ticks}, now=cycle_now
+        ),
+        redis_client.get(digest_key),
+    )
+
+    for ad, usd_value in priced:
+        # Row order matches _UNIFIED_ASSET_COPY_COLUMNS
+        new_assets.append(
+            (
+                uuid4(),
+                user_id,
+                integration.id,
                 ad.symbol,
-                integration.provider_id,
-                price_usd,
-                settings.BASE_CURRENCY,
-            )
-            calculated_change = await PriceTrackingService.calculate_24h_change(
-                price_db, ad.symbol, integration.provider_id, price_usd
+                ad.name,
+                ad.original_symbol or ad.symbol,
+                ad.asset_type.name,  # the assettype enum stores member names
+                ad.isin,
+                ad.amount,
+                ad.currency,
+                ad.price,
+                changes.get(ad.symbol, 0.0),
+                usd_value,
+                ad.image_url,
             )
+        )
 
-            asset = UnifiedAsset(
-                user_id=user_id,
-                integration_id=integration.id,
-                symbol=ad.symbol,
-                name=ad.name,
-                original_name=ad.original_symbol or ad.symbol,
-                asset_type=ad.asset_type,
-                isin=ad.isin,
-                amount=ad.amount,
-                currency=ad.currency,
-                current_price=ad.price,
-                change_24h=calculated_change,
-                usd_value=usd_value,
-                image_url=ad.image_url,
-            )
-            new_assets.append(asset)
-        await price_db.commit()
+    # One INSERT for the whole cycle instead of a SELECT + INSERT per asset
+    await PriceTrackingService.record_prices_bulk(db, price_ticks, now=cycle_now)
 
     _update_progress(task_instance, 85, "SAVING", "Saving to database...")
 
-    async with session_factory() as db:
-        async with db.begin():
-            await db.execute(delete(UnifiedAsset).where(UnifiedAsset.integration_id == integration.id))
-            if new_assets:
-                db.add_all(new_assets)
-            # auto-commit on exit from begin()
+    # Identical balances, prices and changes as the last committed sync: the stored rows
+    # are already correct, so skip the rewrite
+    digest = _assets_digest(new_assets)
+    unchanged = stored_digest == digest
+
+    # Price history and the asset rewrite share the transaction opened by the 24h lookup.
+    # The total is refreshed either way (one indexed upsert), so a total left wrong by a
+    # concurrent delete is corrected even while balances stay flat.
+    if not unchanged:
+        await _write_unified_assets(db, integration.id, new_assets)
+    await SnapshotService.refresh_portfolio_total(db, user_id)
+    await db.commit()
+
+    # All post-commit bookkeeping in one round trip. The data is committed, so a Redis
+    # hiccup here must not fail the sync; the caches recover on their own.
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            SnapshotService.queue_integration_synced(pipe, user_id, integration.id, bool(new_assets))
+            if not unchanged:
+                pipe.set(digest_key, digest, ex=ASSET_DIGEST_TTL_SEC)
+            pipe.set(f"sync_last_time:{user_id}", str(time.time()))
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Post-sync cache update failed for integration {integration.id}: {e}")
+        # A missed SADD would leave the synced set undercounting, and the snapshot fast path
+        # would then take this sync's total as the user's whole net worth: reseed from SQL instead
+        await SnapshotService.invalidate_completeness_cache(redis_client, user_id)
 
     logger.info(
         f"Committed {len(new_assets)} assets for integration {integration.id}. Total: ${total_portfolio_value:,.2f}"
     )
 
-    _update_progress(task_instance, 92, "SNAPSHOT", "Creating portfolio snapshot...")
+    if create_snapshot:
+        _update_progress(task_instance, 92, "SNAPSHOT", "Creating portfolio snapshot...")
+        # Own transaction: the snapshot protocol relies on the assets above being committed
+        await snapshot_service.create_or_update_snapshot(
+            db, user_id, len(new_assets), hint_total_usd=total_portfolio_value
+        )
 
-    async with session_factory() as snapshot_db:
-        await snapshot_service.create_or_update_snapshot(snapshot_db, user_id, len(new_assets))
-
-    await redis_client.set(f"sync_last_time:{user_id}", str(time.time()))
     _update_progress(task_instance, 100, "DONE", "Sync complete")
     logger.info(f"Successfully synced {len(new_assets)} assets. Total Value: ${total_portfolio_value:,.2f}")
 
 
 def _update_progress(task_instance, current: int, stage: str, message: str):
-    """Helper for updating Celery task state."""
+    """Helper for updating Celery task state.
+
+    Each update is a synchronous result-backend write, so intermediate stages reported
+    within PROGRESS_MIN_INTERVAL_SEC of the previous update are coalesced away.
+    """
     if not task_instance:
         return
 
+    task_id = task_instance.request.id
+    now = time.monotonic()
+    if stage in _PROGRESS_TERMINAL_STAGES:
+        _progress_sent_at.pop(task_id, None)
+    else:
+        last_sent = _progress_sent_at.get(task_id)
+        if last_sent is not None and now - last_sent < PROGRESS_MIN_INTERVAL_SEC:
+            return
+        _progress_sent_at[task_id] = now
+
     task_instance.update_state(
         state="PROGRESS",
         meta={
@@ -226,52 +525,148 @@ def _update_progress(task_instance, current: int, stage: str, message: str):
 
 
 @celery_app.task(bind=True, name="sync_integration_data")
-def sync_integration_data(self, integration_id: str):
-    """Celery task wrapper for async sync logic."""
+def sync_integration_data(self, integration_id: str, create_snapshot: bool = True, pending_owner: Optional[str] = None):
+    """Celery task wrapper for async sync logic.
+
+    Releases the integration's pending marker when done, if it is held by
+    `pending_owner` (a re-queued global sync) or by this task's id (a manual trigger).
+    """
 
     async def _runner():
+        retrying = False
         try:
-            return await sync_integration_data_async(integration_id, task_instance=self)
+            return await sync_integration_data_async(
+                integration_id, task_instance=self, create_snapshot=create_snapshot
+            )
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 429:
                 logger.warning(f"Rate limited by provider for integration {integration_id}. Retrying task in 60s...")
-                # Task retry for Celery
-                raise self.retry(exc=e, countdown=60, max_retries=5)
+                # Task retry for Celery; once retries are exhausted self.retry re-raises `e`
+                retrying = self.request.retries < SYNC_RATE_LIMIT_MAX_RETRIES
+                raise self.retry(exc=e, countdown=60, max_retries=SYNC_RATE_LIMIT_MAX_RETRIES)
             raise
         except Exception as e:
             logger.error(f"Unexpected error in sync_integration_data: {e}")
             raise
         finally:
-            await dispose_loop_engine()
-            await close_redis_client()
+            _progress_sent_at.pop(self.request.id, None)
+            if not retrying:
+                # Lets the next global sync queue this integration again
+                await release_sync_pending(get_redis_client(), integration_id, pending_owner or self.request.id)
+
+    return run_async(_runner())
 
-    return asyncio.run(_runner())
+
+@celery_app.task(name="sync_integration_batch", time_limit=SYNC_BATCH_TIME_LIMIT_SEC)
+def sync_integration_batch(integration_ids: list, pending_owner: str):
+    """Syncs several integrations concurrently on this worker's event loop (global sync).
+
+    Syncs are I/O bound, so overlapping them in one task beats one Celery task per
+    integration. A failed sync is logged and doesn't affect the rest of the batch; a
+    rate-limited one is re-queued as a standalone `sync_integration_data` task.
+    `pending_owner` is the token the dispatching global sync stored in the pending markers.
+    """
+
+    async def _sync_one(semaphore: asyncio.Semaphore, integration_id: str):
+        requeued = False
+        try:
+            async with semaphore:
+                await sync_integration_data_async(integration_id, create_snapshot=False)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 429:
+                logger.warning(f"Rate limited by provider for integration {integration_id}. Retrying task in 60s...")
+                # The pending marker stays set; the re-queued task clears it
+                sync_integration_data.apply_async(
+                    (integration_id,), {"create_snapshot": False, "pending_owner": pending_owner}, countdown=60
+                )
+                requeued = True
+            else:
+                logger.error(f"Sync failed for integration {integration_id}: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error in sync_integration_batch for {integration_id}: {e}")
+        finally:
+            if not requeued:
+                await release_sync_pending(get_redis_client(), integration_id, pending_owner)
+
+    async def _runner():
+        semaphore = asyncio.Semaphore(SYNC_BATCH_CONCURRENCY)
+        await asyncio.gather(*(_sync_one(semaphore, integration_id) for integration_id in integration_ids))
+
+    run_async(_runner())
 
 
 @celery_app.task(name="trigger_global_sync")
 def trigger_global_sync():
     """Scheduled task to trigger sync for ALL active integrations.
 
-    Dispatches individual sync tasks for each integration.
+    Dispatches the integrations in `sync_integration_batch` tasks of SYNC_BATCH_SIZE
+    as a chord whose callback snapshots every affected user in one batch. The
+    callback is also linked as the errback, so one failed batch doesn't cost
+    everyone their snapshot.
     """
     logger.info("⏰ Global Sync: Starting scheduled update for all users...")
 
     async def dispatch_all():
         engine = get_async_engine()
+        redis_client = get_redis_client()
+        header = []
+        batch = []
+        user_ids = set()
+        claimed_count = 0
+        skipped = 0
+        # Stored in the pending markers claimed by this run; only its batches release them
+        owner = str(uuid4())
         async with engine.connect() as conn:
-            result = await conn.execute(
-                select(Integration.id).where(Integration.is_active == True)  # noqa: E712
+            # Server-side cursor: rows are turned into signatures batch by batch
+            # instead of buffering the whole result set first.
+            result = await conn.stream(
+                select(Integration.id, Integration.user_id)
+                .where(Integration.is_active == True)  # noqa: E712
+                .execution_options(yield_per=GLOBAL_SYNC_FETCH_BATCH)
             )
-            ids = result.scalars().all()
-            logger.info(f"⏰ Global Sync: Found {len(ids)} integrations to update.")
-
-            for int_id in ids:
-                sync_integration_data.delay(str(int_id))
+            async for rows in result.partitions():
+                # Single-flight: skip integrations that already have a sync queued or running
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for int_id, _ in rows:
+                        pipe.set(f"{SYNC_PENDING_PREFIX}{int_id}", owner, nx=True, ex=SYNC_PENDING_TTL_SEC)
+                    claimed = await pipe.execute()
+                for (int_id, user_id), is_new in zip(rows, claimed):
+                    if not is_new:
+                        skipped += 1
+                        continue
+                    batch.append(str(int_id))
+                    user_ids.add(user_id)
+                    claimed_count += 1
+                    if len(batch) == SYNC_BATCH_SIZE:
+                        header.append(sync_integration_batch.si(batch, owner))
+                        batch = []
+        if batch:
+            header.append(sync_integration_batch.si(batch, owner))
+
+        logger.info(
+            f"⏰ Global Sync: Found {claimed_count + skipped} integrations, "
+            f"{claimed_count} to update in {len(header)} batches ({skipped} already pending)."
+        )
+        if header:
+            snapshots = create_snapshots_batch.si(sorted(user_ids))
+            snapshots.link_error(create_snapshots_batch.si(sorted(user_ids)))
+            chord(header)(snapshots)
+
+    run_async(dispatch_all())
+
+
+@celery_app.task(name="create_snapshots_batch")
+def create_snapshots_batch(user_ids: list):
+    """Creates portfolio snapshots for many users at once (after a global sync)."""
 
-        await dispose_loop_engine()
-        await close_redis_client()
+    async def _run():
+        redis_client = get_redis_client()
+        snapshot_service = SnapshotService(redis_client)
+        session_factory = get_async_sessionmaker()
+        async with session_factory() as db:
+            await snapshot_service.create_or_update_snapshots_batch(db, user_ids)
 
-    asyncio.run(dispatch_all())
+    run_async(_run())
 
 
 @celery_app.task(name="cleanup_price_history")
@@ -281,17 +676,20 @@ def cleanup_price_history():
 
     async def run_cleanup():
         engine = get_async_engine()
-        async with engine.begin() as conn:
-            cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
-                hours=settings.PRICE_HISTORY_KEEP_HOURS
-            )
-            result = await conn.execute(delete(MarketPriceHistory).where(MarketPriceHistory.timestamp < cutoff))
-            logger.info(f"Deleted {result.rowcount} old price history records.")
-
-        await dispose_loop_engine()
-        await close_redis_client()
-
-    asyncio.run(run_cleanup())
+        # Bounded batches, each in its own short transaction: no long-held locks and
+        # vacuum can reclaim space while the cleanup is still running
+        deleted = 0
+        while True:
+            async with engine.begin() as conn:
+                result = await conn.execute(_STMT_DELETE_OLD_PRICES)
+            deleted += result.rowcount
+            if result.rowcount < PRICE_HISTORY_DELETE_BATCH:
+                break
+            # Let concurrent price inserts (and this loop's other tasks) get a turn
+            await asyncio.sleep(PRICE_HISTORY_DELETE_PAUSE_SEC)
+        logger.info(f"Deleted {deleted} old price history records.")
+
+    run_async(run_cleanup())
 
 
 @celery_app.task(bind=True, name="compute_volatility")
@@ -304,26 +702,22 @@ def compute_volatility(self, user_id: int, asset_filter: str = "all"):
 
     async def _run():
         session_factory = get_async_sessionmaker()
-        try:
-            async with session_factory() as db:
-                provider = AnalyticsDataProvider()
-                af = AssetFilter(asset_filter)
-                data = await provider.get_portfolio_data(db, user_id, af)
+        async with session_factory() as db:
+            provider = AnalyticsDataProvider()
+            af = AssetFilter(asset_filter)
+            data = await provider.get_portfolio_data(db, user_id, af)
 
-                calculator = VolatilityCalculator()
-                result = calculator.calculate(data)
-
-                store = AnalyticsResultStore()
-                redis = get_redis_client()
-                await store.save(db, redis, user_id, result, af)
-                await db.commit()
-                logger.info(f"Volatility recomputed for user {user_id}: {result.display_value}")
-                return result.to_dict()
-        finally:
-            await dispose_loop_engine()
-            await close_redis_client()
+            calculator = VolatilityCalculator()
+            result = calculator.calculate(data)
 
-    return asyncio.run(_run())
+            store = AnalyticsResultStore()
+            redis = get_redis_client()
+            await store.save(db, redis, user_id, result, af)
+            await db.commit()
+            logger.info(f"Volatility recomputed for user {user_id}: {result.display_value}")
+            return result.to_dict()
+
+    return run_async(_run())
 
 
 @celery_app.task(bind=True, name="compute_volatility_custom")
@@ -414,11 +808,8 @@ def compute_volatility_custom(
             logger.error(f"compute_volatility_custom failed: {e}", exc_info=True)
             self.update_state(state="FAILURE", meta={"percent": 0, "status": "ERROR", "message": str(e)})
             raise
-        finally:
-            await dispose_loop_engine()
-            await close_redis_client()
 
-    return asyncio.run(_run())
+    return run_async(_run())
 
 
 @celery_app.task(name="backfill_pricing_history")
@@ -446,7 +837,5 @@ def backfill_pricing_history(user_id: int):
             logger.error(f"backfill_pricing_history failed for user {user_id}: {e}")
         finally:
             await redis.delete(lock_key)
-            await dispose_loop_engine()
-            await close_redis_client()
 
-    asyncio.run(_runner())
+    run_async(_runner())